@@ -2,16 +2,50 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import tksheet
 import os
+import sys
+import errno
 import shutil
+import tempfile
+import bisect
+import queue
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import csv
 import json
 import math
+import sqlite3
+import hashlib
+import numpy as np
 import pandas as pd
-from io import StringIO
+from io import StringIO, BytesIO
 from PIL import Image, ImageTk
 from datetime import datetime, timedelta
 
 CONFIG_FILE = "app_config.json"
+SCAN_CACHE_FILE = "scan_cache.sqlite"
+COPY_MANIFEST_FILE = "copy_manifest.sqlite"
+THUMBNAIL_CACHE_FILE = "thumbnail_cache.sqlite"
+THUMBNAIL_CACHE_MAX_MB = 256
+THUMBNAIL_TOUCH_BATCH = 64
+VIEWER_IMAGE_SIZE = (760, 520)
+GALLERY_TILE_SIZE = (160, 120)
+GALLERY_WORKERS = 4
+GALLERY_MEMORY_TILES = 400
+VIEWER_PREFETCH = 3
+VIEWER_CACHE_MB = 256
+WATCH_POLL_SECONDS = 10.0
+WATCH_DRAIN_MS = 500
+PROGRESS_DRAIN_MS = 100
+SCAN_WORKERS = 8
+FORMAT_APPLY_DELAY_MS = 600
+COPY_WORKERS = 4
+COPY_CHUNK_SIZE = 1024 * 1024
+BACKGROUND_SYNC_SECONDS = 300
+LIVE_INGEST_SECONDS = 2.0
 
 
 def get_default_config():
@@ -66,26 +100,264 @@ def save_app_config(config):
     with open(CONFIG_FILE, "w") as f:
         json.dump(config, f, indent=2)
 
-def extract_date_time_from_filename(filename, format_config, date_fmt, time_fmt):
+def extract_date_time_from_filename(filename, plan, date_fmt, time_fmt):
     """
-    Extract datetime from filename using format_config (start/len for Date/Time) and supplied formats.
+    Extract datetime from filename using the Date/Time fields of a FilenameFormatPlan and supplied formats.
     Returns a pandas.Timestamp or pd.NaT.
     """
     fname = os.path.splitext(os.path.basename(filename))[0]
-    date_info = format_config.get('Date', {})
-    time_info = format_config.get('Time', {})
+    fields = plan.slice(fname)
     try:
-        d_start = int(date_info.get('start', 0))
-        d_len = int(date_info.get('length', 0))
-        t_start = int(time_info.get('start', 0))
-        t_len = int(time_info.get('length', 0))
-        date_str = fname[d_start:d_start+d_len]
-        time_str = fname[t_start:t_start+t_len]
-        dt = pd.to_datetime(date_str + time_str, format=(date_fmt + time_fmt), errors='coerce')
-        return dt
+        return pd.to_datetime((fields.get("Date") or "") + (fields.get("Time") or ""), format=(date_fmt + time_fmt), errors='coerce')
     except Exception:
         return pd.NaT
 
+FILENAME_FIELDS = ["Line", "Point", "Index", "Bumper", "Date", "Time", "ROV"]
+
+
+class FilenameFormatPlan:
+    """
+    A filename format_config compiled once: the (start, length) span of every defined
+    field, checked up front for malformed, empty, overlapping and out-of-range fields.
+    Used by the vectorized parser, the sample preview and the example label.
+    """
+    def __init__(self, spans, errors):
+        self.spans = spans    # {field: (start, length)} for every numeric field
+        self.errors = errors  # {field: message}
+
+    @classmethod
+    def compile(cls, format_config, max_length=None):
+        """
+        Build a plan from {field: {"start": str, "length": str}}. A field with both
+        values empty is simply undefined. With max_length (e.g. the longest sample
+        filename), fields reaching past the end of the name are rejected.
+        """
+        spans, errors = {}, {}
+        for field in FILENAME_FIELDS:
+            conf = format_config.get(field, {}) or {}
+            start = str(conf.get("start") or "").strip()
+            length = str(conf.get("length") or "").strip()
+            if not start and not length:
+                continue
+            if not (start.isdigit() and length.isdigit()):
+                errors[field] = "start and length must be whole numbers"
+                continue
+            s, l = int(start), int(length)
+            if l == 0:
+                errors[field] = "length must be at least 1"
+                continue
+            spans[field] = (s, l)
+            if max_length is not None and s + l > max_length:
+                errors[field] = f"ends at {s + l}, past the end of the filename ({max_length} characters)"
+        ordered = sorted(spans.items(), key=lambda item: item[1][0])
+        for (field_a, (s_a, l_a)), (field_b, (s_b, _)) in zip(ordered, ordered[1:]):
+            if s_b < s_a + l_a:
+                errors.setdefault(field_a, f"overlaps {field_b}")
+                errors.setdefault(field_b, f"overlaps {field_a}")
+        return cls(spans, errors)
+
+    @property
+    def is_valid(self):
+        return not self.errors
+
+    def describe_errors(self):
+        return "; ".join(f"{field}: {msg}" for field, msg in self.errors.items())
+
+    def span(self, field):
+        return self.spans.get(field)
+
+    def slice(self, stem):
+        """Field values of one filename stem (None for undefined fields)."""
+        return {
+            field: (stem[self.spans[field][0]:sum(self.spans[field])] if field in self.spans else None)
+            for field in FILENAME_FIELDS
+        }
+
+
+def filename_fields_frame(files, plan, datetime_format=None):
+    """
+    Slice the fixed-width fields of a FilenameFormatPlan out of every filename at once.
+    The full paths are packed into one fixed-width NumPy unicode array and their
+    basenames shifted to the left edge (one slice per distinct directory length), so
+    each field is a column slice of the code points instead of a Python loop per file.
+    Returns a DataFrame indexed by path with one column per field plus 'filename'
+    (the basename). A field the plan does not define is None for every row.
+    With datetime_format=(date_fmt, time_fmt), Date and Time are replaced by a
+    'Datetime' column (see decode_filename_datetimes).
+    """
+    paths = list(files)
+    n = len(paths)
+    packed = np.array(paths, dtype=str)
+    codes = packed.view(np.uint32).reshape(n, packed.dtype.itemsize // 4)
+    lengths = np.char.str_len(packed)
+    start = np.maximum(np.char.rfind(packed, "/"), np.char.rfind(packed, "\\")) + 1
+    width = int((lengths - start).max(initial=1))
+    names = np.zeros((n, width), dtype=np.uint32)
+    for offset in np.unique(start).tolist():
+        rows = start == offset
+        block = codes[rows, offset:offset + width]
+        names[rows, :block.shape[1]] = block
+    # The stem ends at the last dot, unless that is the first character (str.rpartition('.')[0] or name)
+    dot = names[:, ::-1] == ord(".")
+    last_dot = width - 1 - dot.argmax(axis=1)
+    stem_end = np.where(dot.any(axis=1) & (last_dot > 0), last_dot, lengths - start)
+
+    texts = {}
+    for field in FILENAME_FIELDS:
+        span = plan.span(field)
+        if span is None:
+            continue
+        s = min(span[0], width)
+        e = min(span[0] + span[1], width)
+        if e > s:
+            block = names[:, s:e].copy()
+            block[np.arange(s, e) >= stem_end[:, None]] = 0
+            # Trailing NULs of shorter stems are dropped by the 'U' dtype
+            texts[field] = block.view(f"U{e - s}").ravel()
+        else:
+            texts[field] = np.full(n, "", dtype="U1")
+
+    datetimes = None
+    if datetime_format is not None:
+        fmt = datetime_format[0] + datetime_format[1]
+        layout = fixed_width_layout(fmt)
+        if layout is not None and layout[2] > 0:
+            # Straight from the code points; the Date/Time strings are never built
+            empty = np.full(n, "", dtype="U1")
+            datetimes = decode_fixed_width_datetimes(
+                np.char.add(texts.pop("Date", empty), texts.pop("Time", empty)), layout
+            )
+    columns = {}
+    for field in FILENAME_FIELDS:
+        if field in texts:
+            columns[field] = texts[field].astype(object)
+        elif datetimes is None or field not in ("Date", "Time"):
+            columns[field] = np.full(n, None, dtype=object)
+    columns["filename"] = names.view(f"U{width}").ravel().astype(object)
+    df = pd.DataFrame(columns, index=pd.Index(paths, name="path", dtype=object))
+    if datetime_format is not None:
+        if datetimes is None:
+            datetimes = decode_filename_datetimes(df["Date"], df["Time"], *datetime_format)
+            df = df.drop(columns=["Date", "Time"])
+        df["Datetime"] = datetimes
+    return df
+
+
+# strftime directives that are always a fixed number of digits
+FIXED_WIDTH_DIRECTIVES = {"Y": 4, "y": 2, "m": 2, "d": 2, "H": 2, "M": 2, "S": 2}
+
+
+def fixed_width_layout(fmt):
+    """
+    Describe an all-digit strftime format such as '%d%m%Y%H%M%S'.
+    Returns (fields, literals, width) with fields as (directive, offset, width) and
+    literals as (offset, char), or None if the format has any other directive.
+    """
+    fields, literals = [], []
+    pos = i = 0
+    while i < len(fmt):
+        if fmt[i] != "%":
+            literals.append((pos, fmt[i]))
+            pos += 1
+            i += 1
+            continue
+        directive = fmt[i + 1] if i + 1 < len(fmt) else ""
+        if directive == "%":
+            literals.append((pos, "%"))
+            pos += 1
+        else:
+            width = FIXED_WIDTH_DIRECTIVES.get(directive)
+            if width is None or any(d == directive for d, _, _ in fields):
+                return None
+            fields.append((directive, pos, width))
+            pos += width
+        i += 2
+    return fields, literals, pos
+
+
+def decode_filename_datetimes(dates, times, date_fmt, time_fmt):
+    """
+    Parse the concatenated Date+Time strings of a filename dataframe into datetime64.
+    All-digit formats go through decode_fixed_width_datetimes; anything that does not
+    match the layout exactly (length, digits, separators, calendar ranges) becomes NaT.
+    Other formats fall back to pd.to_datetime.
+    """
+    index = dates.index
+    dates = dates.fillna("")
+    times = times.fillna("")
+    fmt = date_fmt + time_fmt
+    layout = fixed_width_layout(fmt)
+    if layout is None or layout[2] == 0:
+        dates = dates.astype(str)
+        times = times.astype(str)
+        text = dates + times
+        mask = (dates != "") & (times != "")
+        try:
+            return pd.to_datetime(text.where(mask), format=fmt, errors="coerce")
+        except Exception:
+            return pd.Series(pd.NaT, index=index, dtype="datetime64[ns]")
+    text = np.char.add(dates.to_numpy(dtype=str), times.to_numpy(dtype=str))
+    return pd.Series(decode_fixed_width_datetimes(text, layout), index=index)
+
+
+def decode_fixed_width_datetimes(text, layout):
+    """
+    Decode a NumPy unicode array laid out as fixed_width_layout() describes into a
+    datetime64[ns] array. The digits are turned into integer year/month/... arrays and
+    assembled into datetime64 directly; rows that do not match the layout are NaT.
+    """
+    fields, literals, width = layout
+    n = len(text)
+    valid = np.char.str_len(text) == width
+    # One contiguous row per character position, so every step below is a flat vector op
+    chars = np.ascontiguousarray(text.astype(f"U{width}").view(np.uint32).reshape(n, width).T)
+    for pos, char in literals:
+        valid &= chars[pos] == ord(char)
+    digits = chars - np.uint32(ord("0"))  # anything but 0-9 wraps around to a large value
+    positions = [k for _, pos, w in fields for k in range(pos, pos + w)]
+    valid &= (digits[positions] <= 9).all(axis=0)
+    parts = {}
+    for directive, pos, w in fields:
+        value = digits[pos].astype(np.int64)
+        for k in range(pos + 1, pos + w):
+            value = value * 10 + digits[k]
+        parts[directive] = value
+
+    if "Y" in parts:
+        year = parts["Y"]
+    elif "y" in parts:
+        year = np.where(parts["y"] < 69, 2000 + parts["y"], 1900 + parts["y"])
+    else:
+        year = np.full(n, 1900)
+    month = parts.get("m", np.ones(n, dtype=np.int64))
+    day = parts.get("d", np.ones(n, dtype=np.int64))
+    hour = parts.get("H", np.zeros(n, dtype=np.int64))
+    minute = parts.get("M", np.zeros(n, dtype=np.int64))
+    second = parts.get("S", np.zeros(n, dtype=np.int64))
+    valid &= (year >= 1678) & (year <= 2261) & (month >= 1) & (month <= 12) & (day >= 1)
+    valid &= (hour < 24) & (minute < 60) & (second < 60)
+
+    # Build on placeholder values for invalid rows, then blank them out
+    year, month, day = np.where(valid, year, 1970), np.where(valid, month, 1), np.where(valid, day, 1)
+    months = ((year - 1970) * 12 + (month - 1)).astype("datetime64[M]")
+    days = months.astype("datetime64[D]") + (day - 1).astype("timedelta64[D]")
+    valid &= days.astype("datetime64[M]") == months  # e.g. 31 April
+    seconds = np.where(valid, hour * 3600 + minute * 60 + second, 0)
+    result = (days.astype("datetime64[s]") + seconds.astype("timedelta64[s]")).astype("datetime64[ns]")
+    result[~valid] = np.datetime64("NaT")
+    return result
+
+
+def filename_timestamps(names, plan, date_fmt, time_fmt):
+    """
+    datetime64 array of the Date+Time parsed from each filename (NaT where it does not
+    parse), or None if the plan has no Date and Time fields.
+    """
+    if plan is None or plan.span("Date") is None or plan.span("Time") is None:
+        return None
+    return filename_fields_frame(names, plan, (date_fmt, time_fmt))["Datetime"].to_numpy()
+
+
 def strip_rov_whitespace_columns(export_df):
     """
     Strip outside whitespace for all columns in export_df whose name contains 'ROV' (case-insensitive).
@@ -181,6 +453,1378 @@ def create_export_df(events_df, deployment_df, recovery_df):
     return export_df
 
 
+PNG_SUBFOLDERS = ("Deployment", "Recovery")
+
+
+def map_parallel(func, items, max_workers=SCAN_WORKERS):
+    """
+    Apply func to every item on a bounded thread pool, so that slow listings on a
+    network share overlap. Results are returned in the order of items.
+    """
+    items = list(items)
+    if len(items) <= 1 or max_workers <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        return list(pool.map(func, items))
+
+
+def list_subdirs(path):
+    """Sorted names of the subdirectories of path ([] if it cannot be listed)."""
+    try:
+        with os.scandir(path) as it:
+            return sorted(entry.name for entry in it if entry.is_dir())
+    except OSError:
+        return []
+
+
+def list_png_entries(path):
+    """Sorted (name, size, mtime_ns) of the PNG files directly in path ([] if it cannot be listed)."""
+    entries = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if not entry.name.lower().endswith('.png'):
+                    continue
+                try:
+                    if entry.is_file():
+                        st = entry.stat()  # taken from the directory listing on Windows
+                        entries.append((entry.name, st.st_size, st.st_mtime_ns))
+                except OSError:
+                    continue
+    except OSError:
+        return []
+    return sorted(entries)
+
+
+# errno values meaning "this fd pair can't use the syscall", as opposed to a real I/O error
+_KERNEL_COPY_UNSUPPORTED = {
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EBADF, errno.ENOTSUP,
+    getattr(errno, "EOPNOTSUPP", errno.ENOTSUP),
+}
+
+
+class RateLimiter:
+    """
+    Token bucket shared by all copy threads, capping their combined throughput.
+    acquire(n) blocks until n bytes may be sent; a chunk larger than the bucket is
+    let through and paid off by sleeping. A rate of 0 means unlimited, and
+    set_rate() may be called while a copy is running.
+    """
+    def __init__(self, bytes_per_s=0, burst_seconds=1.0):
+        self._lock = threading.Lock()
+        self.burst_seconds = burst_seconds
+        self.bytes_per_s = 0
+        self._tokens = 0.0
+        self._last = time.monotonic()
+        self.set_rate(bytes_per_s)
+
+    def set_rate(self, bytes_per_s):
+        with self._lock:
+            self.bytes_per_s = max(0, float(bytes_per_s or 0))
+            self._tokens = min(self._tokens, self.bytes_per_s * self.burst_seconds)
+
+    def acquire(self, n):
+        with self._lock:
+            rate = self.bytes_per_s
+            if rate <= 0:
+                return
+            now = time.monotonic()
+            self._tokens = min(rate * self.burst_seconds, self._tokens + (now - self._last) * rate)
+            self._last = now
+            self._tokens -= n
+            wait = -self._tokens / rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+
+def _kernel_copy(fd_in, fd_out, size):
+    """
+    Copy size bytes between file descriptors without passing them through user space:
+    os.copy_file_range first (lets filesystems reflink and NFS/SMB servers copy
+    server-side), then os.sendfile. Returns False if neither works for this pair
+    and nothing was written.
+    """
+    for name in ("copy_file_range", "sendfile"):
+        syscall = getattr(os, name, None)
+        if syscall is None:
+            continue
+        copied = 0
+        try:
+            while copied < size:
+                count = size - copied
+                if name == "copy_file_range":
+                    n = syscall(fd_in, fd_out, count)
+                else:
+                    n = syscall(fd_out, fd_in, copied, count)
+                if n == 0:
+                    break
+                copied += n
+        except OSError as e:
+            if copied == 0 and e.errno in _KERNEL_COPY_UNSUPPORTED:
+                continue
+            raise
+        if copied == size:
+            return True
+        if copied:
+            raise OSError(f"short copy: {copied} of {size} bytes")
+    return False
+
+
+def copy_file_kernel(src, dest):
+    """
+    Copy with os.copy_file_range / os.sendfile where the platform has them (Linux).
+    Anywhere else, or if the kernel refuses this pair of files, it is shutil.copy2.
+    """
+    if hasattr(os, "copy_file_range") or hasattr(os, "sendfile"):
+        with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+            size = os.fstat(fsrc.fileno()).st_size
+            done = size == 0 or _kernel_copy(fsrc.fileno(), fdst.fileno(), size)
+        if done:
+            shutil.copystat(src, dest)
+            return
+    shutil.copy2(src, dest)
+
+
+def copy_file_throttled(src, dest, limiter):
+    """Buffered copy in COPY_CHUNK_SIZE chunks, each paid for with the RateLimiter first."""
+    with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+        for chunk in iter(lambda: fsrc.read(COPY_CHUNK_SIZE), b""):
+            limiter.acquire(len(chunk))
+            fdst.write(chunk)
+    shutil.copystat(src, dest)
+
+
+# shutil.copy2 is the default; "kernel" is opt-in via general["copy_backend"]
+COPY_BACKENDS = {"shutil": shutil.copy2, "kernel": copy_file_kernel}
+
+
+def copy_file_atomic(src, dest, verify=None, copy_func=shutil.copy2):
+    """
+    Copy src to dest through a temporary 'dest.part' file that is renamed over dest
+    only once complete (and accepted by verify(tmp_path), if given), so an interrupted
+    copy never leaves a half-written PNG under its final name.
+    """
+    tmp = dest + ".part"
+    try:
+        copy_func(src, tmp)
+        if verify:
+            verify(tmp)
+        os.replace(tmp, dest)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def bench_copy_backends(file_count=40, file_size_mb=8, repeats=3, folder=None):
+    """
+    Micro-benchmark of the copy backends on file_count files of file_size_mb MB in a
+    temporary directory (under folder, e.g. a mounted share, if given), to decide
+    per site whether general["copy_backend"] = "kernel" is worth it. The chunked
+    user-space copy used under a rate cap is included, uncapped, for comparison.
+    Returns {name: MB/s}, best of repeats.
+    """
+    unlimited = RateLimiter()
+    backends = dict(COPY_BACKENDS, userspace=lambda src, dest: copy_file_throttled(src, dest, unlimited))
+    results = {}
+    with tempfile.TemporaryDirectory(dir=folder) as tmp:
+        src_dir = os.path.join(tmp, "src")
+        os.makedirs(src_dir)
+        block = os.urandom(1024 * 1024)
+        sources = []
+        for i in range(file_count):
+            path = os.path.join(src_dir, f"bench_{i:04d}.png")
+            with open(path, "wb") as f:
+                for _ in range(file_size_mb):
+                    f.write(block)
+            sources.append(path)
+        total_mb = file_count * file_size_mb
+        for name, copy_func in backends.items():
+            best = None
+            for run in range(repeats):
+                dest_dir = os.path.join(tmp, f"{name}_{run}")
+                os.makedirs(dest_dir)
+                started = time.perf_counter()
+                for path in sources:
+                    copy_file_atomic(path, os.path.join(dest_dir, os.path.basename(path)), copy_func=copy_func)
+                elapsed = time.perf_counter() - started
+                shutil.rmtree(dest_dir)
+                best = elapsed if best is None else min(best, elapsed)
+            results[name] = total_mb / best if best else 0.0
+    return results
+
+
+def file_checksum(path, chunk_size=1024 * 1024):
+    """SHA-1 hex digest of a file."""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def format_bytes(num_bytes):
+    """Human readable size, e.g. 1.5 GB."""
+    size = float(num_bytes)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            break
+        size /= 1024
+    return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+
+
+def format_duration(seconds):
+    """h:mm:ss, or m:ss under an hour."""
+    minutes, secs = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}" if hours else f"{minutes}:{secs:02d}"
+
+
+def summarize_copy_plan(file_list, to_copy):
+    """
+    Group a planned nav copy by (line, kind). Each value holds the number of files and
+    bytes that would be copied and that would be skipped as already present.
+    """
+    copy_srcs = {item["src"] for item in to_copy}
+    summary = {}
+    for item in file_list:
+        row = summary.setdefault(
+            (item["line"], item["kind"]),
+            {"copy_files": 0, "copy_bytes": 0, "skip_files": 0, "skip_bytes": 0},
+        )
+        prefix = "copy" if item["src"] in copy_srcs else "skip"
+        row[prefix + "_files"] += 1
+        row[prefix + "_bytes"] += item["size"]
+    return dict(sorted(summary.items()))
+
+
+@contextmanager
+def sqlite_connection(path):
+    """
+    SQLite connection that commits on success, rolls back on error and is always
+    closed; sqlite3's own context manager only ends the transaction.
+    """
+    conn = sqlite3.connect(path)
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+
+class ScanCache:
+    """
+    Persistent SQLite cache of directory listings below a Pictures folder.
+    Each row stores a directory's mtime with its subdirectories and PNG files, so
+    a directory whose mtime did not change does not need to be listed again.
+    A connection is opened per call, so the cache can be used from any thread.
+    """
+    def __init__(self, path=SCAN_CACHE_FILE):
+        self.path = path
+        with sqlite_connection(self.path) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS dirs ("
+                "root TEXT, reldir TEXT, mtime_ns INTEGER, subdirs TEXT, pngs TEXT, "
+                "PRIMARY KEY (root, reldir))"
+            )
+
+    def load(self, root):
+        with sqlite_connection(self.path) as conn:
+            rows = conn.execute(
+                "SELECT reldir, mtime_ns, subdirs, pngs FROM dirs WHERE root = ?", (root,)
+            ).fetchall()
+        return {
+            reldir: {"mtime_ns": mtime_ns, "subdirs": json.loads(subdirs), "pngs": json.loads(pngs)}
+            for reldir, mtime_ns, subdirs, pngs in rows
+        }
+
+    def store(self, root, dirs):
+        with sqlite_connection(self.path) as conn:
+            conn.execute("DELETE FROM dirs WHERE root = ?", (root,))
+            conn.executemany(
+                "INSERT INTO dirs (root, reldir, mtime_ns, subdirs, pngs) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (root, reldir, d.get("mtime_ns"), json.dumps(d["subdirs"]), json.dumps(d["pngs"]))
+                    for reldir, d in dirs.items()
+                ]
+            )
+
+
+class ThumbnailCache:
+    """
+    Persistent SQLite store of downscaled previews (JPEG blobs). An entry is keyed by
+    the source path, its size and mtime, and the bounding box it was scaled to, so a
+    changed file is never served a stale preview. Entries carry a last-used time and
+    the least recently used ones are evicted once the store exceeds max_bytes.
+    The database runs in WAL mode so gallery and prefetch workers can read while
+    another thread writes; reads only note their last-used time in memory, and
+    those times are written in batches under the same lock as put().
+    """
+    def __init__(self, path=THUMBNAIL_CACHE_FILE, max_bytes=THUMBNAIL_CACHE_MAX_MB * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._touched = {}  # (path, box) -> last-used time not yet written
+        with sqlite_connection(self.path) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS thumbs ("
+                "path TEXT, box TEXT, size INTEGER, mtime_ns INTEGER, data BLOB, nbytes INTEGER, last_used REAL, "
+                "PRIMARY KEY (path, box))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS thumbs_last_used ON thumbs (last_used)")
+            self._total = conn.execute("SELECT COALESCE(SUM(nbytes), 0) FROM thumbs").fetchone()[0]
+
+    @staticmethod
+    def _box_key(box):
+        return f"{box[0]}x{box[1]}"
+
+    def get(self, path, box):
+        """Cached preview of path scaled to fit box, or None if missing or stale."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        with sqlite_connection(self.path) as conn:
+            row = conn.execute(
+                "SELECT data FROM thumbs WHERE path = ? AND box = ? AND size = ? AND mtime_ns = ?",
+                (path, self._box_key(box), st.st_size, st.st_mtime_ns)
+            ).fetchone()
+        if row is None:
+            return None
+        with self._lock:
+            self._touched[(path, self._box_key(box))] = time.time()
+            if len(self._touched) >= THUMBNAIL_TOUCH_BATCH:
+                with sqlite_connection(self.path) as conn:
+                    self._flush_touched(conn)
+        img = Image.open(BytesIO(row[0]))
+        img.load()
+        return img
+
+    def put(self, path, box, img, size, mtime_ns):
+        """Store img as the preview of path (at the given source size/mtime) for box."""
+        buf = BytesIO()
+        img.convert("RGB").save(buf, format="JPEG", quality=85)
+        data = buf.getvalue()
+        with self._lock, sqlite_connection(self.path) as conn:
+            self._flush_touched(conn)
+            old = conn.execute(
+                "SELECT nbytes FROM thumbs WHERE path = ? AND box = ?", (path, self._box_key(box))
+            ).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO thumbs (path, box, size, mtime_ns, data, nbytes, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (path, self._box_key(box), size, mtime_ns, sqlite3.Binary(data), len(data), time.time())
+            )
+            self._total += len(data) - (old[0] if old else 0)
+            if self._total > self.max_bytes:
+                self._evict(conn)
+
+    def _flush_touched(self, conn):
+        # Caller holds self._lock
+        if self._touched:
+            conn.executemany(
+                "UPDATE thumbs SET last_used = ? WHERE path = ? AND box = ?",
+                [(used, path, box) for (path, box), used in self._touched.items()]
+            )
+            self._touched.clear()
+
+    def _evict(self, conn):
+        # Drop least recently used previews until usage is at or below 90% of the budget,
+        # reading the oldest rows a batch at a time instead of the whole table
+        target = self.max_bytes * 0.9
+        while self._total > target:
+            rows = conn.execute(
+                "SELECT path, box, nbytes FROM thumbs ORDER BY last_used LIMIT 256"
+            ).fetchall()
+            if not rows:
+                break
+            for path, box, nbytes in rows:
+                if self._total <= target:
+                    break
+                conn.execute("DELETE FROM thumbs WHERE path = ? AND box = ?", (path, box))
+                self._total -= nbytes
+
+    def thumbnail(self, path, box):
+        """Preview of path scaled (LANCZOS, never enlarged) to fit box, from the cache or decoded and stored."""
+        img = self.get(path, box)
+        if img is not None:
+            return img
+        st = os.stat(path)
+        img = load_preview(path, box)
+        self.put(path, box, img, st.st_size, st.st_mtime_ns)
+        return img
+
+
+def _fit_size(size, box):
+    w, h = size
+    ratio = min(box[0] / w, box[1] / h, 1.0)
+    return max(1, int(w * ratio)), max(1, int(h * ratio))
+
+
+def open_for_preview(path, box):
+    """
+    Open and decode path for a preview that fits box. Formats with reduced-resolution
+    decoding (JPEG's DCT scaling via draft) are decoded at the smallest scale still
+    covering box; PNG has no such mode and is decoded in full.
+    """
+    with Image.open(path) as img:
+        img.draft("RGB", box)
+        img.load()
+        return img.copy() if img.mode in ("RGB", "RGBA", "L", "LA") else img.convert("RGBA")
+
+
+def fast_preview(img, box):
+    """Quick low-quality scale to fit box: integer box-reduce, then a bilinear fit."""
+    size = _fit_size(img.size, box)
+    factor = min(img.width // size[0], img.height // size[1])
+    if factor > 1:
+        img = img.reduce(factor)
+    return img.resize(size, Image.Resampling.BILINEAR)
+
+
+def hq_preview(img, box):
+    """
+    High-quality scale to fit box (LANCZOS, never enlarged). reducing_gap lets Pillow
+    box-reduce large images first, which is much faster and visually equivalent.
+    """
+    return img.resize(_fit_size(img.size, box), Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+
+def load_preview(path, box):
+    """Decode path and scale it to fit box in high quality."""
+    return hq_preview(open_for_preview(path, box), box)
+
+
+class PreviewPrefetcher:
+    """
+    Memory-bounded LRU of decoded previews, filled ahead of time by a small pool.
+    prefetch(paths) queues paths nearest first and drops earlier requests that are
+    no longer wanted; peek(path) returns a ready image without decoding, and
+    refine() makes the high-quality preview of an image the viewer decoded itself.
+    Only PIL images are kept here, PhotoImages must be made on the Tk thread.
+    """
+    def __init__(self, load, box, max_bytes=VIEWER_CACHE_MB * 1024 * 1024, max_workers=2):
+        self.load = load
+        self.box = box
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._images = OrderedDict()  # path -> PIL image, least recently used first
+        self._bytes = 0
+        self._pending = set()
+        self._wanted = frozenset()
+        self._pool = ThreadPoolExecutor(max_workers=max(1, int(max_workers)))
+
+    @staticmethod
+    def _image_bytes(img):
+        return img.width * img.height * len(img.getbands())
+
+    def peek(self, path):
+        """The ready image for path, or None; never decodes."""
+        with self._lock:
+            img = self._images.get(path)
+            if img is not None:
+                self._images.move_to_end(path)
+            return img
+
+    def refine(self, path, decoded, on_ready):
+        """Make the high-quality preview of an already decoded image on the pool, then on_ready(path, img)."""
+        def run():
+            img = hq_preview(decoded, self.box)
+            self.store(path, img)
+            on_ready(path, img)
+        self._pool.submit(run)
+
+    def prefetch(self, paths):
+        with self._lock:
+            self._wanted = frozenset(paths)
+            todo = [p for p in paths if p not in self._images and p not in self._pending]
+            self._pending.update(todo)
+        for path in todo:
+            self._pool.submit(self._load, path)
+
+    def close(self):
+        """Drop queued work; running decodes finish but are not waited for."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def discard(self, path):
+        with self._lock:
+            img = self._images.pop(path, None)
+            if img is not None:
+                self._bytes -= self._image_bytes(img)
+
+    def _load(self, path):
+        try:
+            if path in self._wanted:
+                self.store(path, self.load(path, self.box))
+        except Exception:
+            pass  # the viewer reports the error if the file is actually shown
+        finally:
+            with self._lock:
+                self._pending.discard(path)
+
+    def store(self, path, img):
+        with self._lock:
+            old = self._images.pop(path, None)
+            if old is not None:
+                self._bytes -= self._image_bytes(old)
+            self._images[path] = img
+            self._bytes += self._image_bytes(img)
+            while self._bytes > self.max_bytes and len(self._images) > 1:
+                _, evicted = self._images.popitem(last=False)
+                self._bytes -= self._image_bytes(evicted)
+
+
+class CopyManifest:
+    """
+    Local SQLite record of the files copied from the nav folder: source path,
+    destination, source size and mtime, and an optional checksum. Lets a later sync
+    decide what to copy from the source listing alone, without stat-ing destinations.
+    Also holds the journal of the sync in progress, so an interrupted sync can resume
+    with the files it had not finished.
+    """
+    def __init__(self, path=COPY_MANIFEST_FILE):
+        self.path = path
+        with sqlite_connection(self.path) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS copied ("
+                "src TEXT PRIMARY KEY, dest TEXT, size INTEGER, mtime_ns INTEGER, checksum TEXT, copied_at REAL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS journal ("
+                "src TEXT PRIMARY KEY, item TEXT, done INTEGER DEFAULT 0)"
+            )
+            conn.execute("CREATE TABLE IF NOT EXISTS journal_meta (nav_folder TEXT, pictures_folder TEXT, started_at REAL)")
+
+    def start_journal(self, nav_folder, pictures_folder, items):
+        with sqlite_connection(self.path) as conn:
+            conn.execute("DELETE FROM journal")
+            conn.execute("DELETE FROM journal_meta")
+            conn.execute("INSERT INTO journal_meta VALUES (?, ?, ?)", (nav_folder, pictures_folder, time.time()))
+            conn.executemany(
+                "INSERT OR REPLACE INTO journal (src, item, done) VALUES (?, ?, 0)",
+                [(item["src"], json.dumps(item)) for item in items]
+            )
+
+    def pending_journal(self, nav_folder, pictures_folder):
+        """Items of an interrupted sync between the same folders that were not copied yet."""
+        with sqlite_connection(self.path) as conn:
+            meta = conn.execute("SELECT nav_folder, pictures_folder FROM journal_meta").fetchone()
+            if meta != (nav_folder, pictures_folder):
+                return []
+            rows = conn.execute("SELECT item FROM journal WHERE done = 0 ORDER BY rowid").fetchall()
+        return [json.loads(item) for (item,) in rows]
+
+    def drop_journal(self, srcs):
+        """Remove items from the journal, e.g. files that failed or whose source changed."""
+        with sqlite_connection(self.path) as conn:
+            conn.executemany("DELETE FROM journal WHERE src = ?", [(src,) for src in srcs])
+
+    def clear_journal(self):
+        with sqlite_connection(self.path) as conn:
+            conn.execute("DELETE FROM journal")
+            conn.execute("DELETE FROM journal_meta")
+
+    def load(self):
+        with sqlite_connection(self.path) as conn:
+            rows = conn.execute("SELECT src, dest, size, mtime_ns, checksum FROM copied").fetchall()
+        return {src: {"dest": dest, "size": size, "mtime_ns": mtime_ns, "checksum": checksum}
+                for src, dest, size, mtime_ns, checksum in rows}
+
+    def record(self, entries):
+        """Store (src, dest, size, mtime_ns, checksum) tuples."""
+        if not entries:
+            return
+        now = time.time()
+        with sqlite_connection(self.path) as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO copied (src, dest, size, mtime_ns, checksum, copied_at) VALUES (?, ?, ?, ?, ?, ?)",
+                [entry + (now,) for entry in entries]
+            )
+            conn.executemany("DELETE FROM journal WHERE src = ?", [(entry[0],) for entry in entries])
+
+
+class ImageInventory:
+    """
+    Index of the PNG files below a Pictures folder, built with a single os.scandir traversal.
+    Keeps, per scanned directory, its subdirectories and PNG files, and per kind
+    ('Deployment' / 'Recovery') the sorted PNG paths relative to that subfolder.
+    """
+    def __init__(self, root=""):
+        self.root = root
+        self.dirs = {}  # reldir -> {"subdirs": [...], "pngs": [...]}
+        self.base_dirs = {kind: None for kind in PNG_SUBFOLDERS}
+        self.files = {kind: [] for kind in PNG_SUBFOLDERS}
+        self.listed_dirs = 0
+        self.cached_dirs = 0
+        self.cancelled = False
+
+    def copy(self):
+        """Independent copy (lists are not shared), e.g. as a watcher snapshot."""
+        other = ImageInventory(self.root)
+        other.dirs = {
+            reldir: dict(entry, subdirs=list(entry["subdirs"]), pngs=list(entry["pngs"]))
+            for reldir, entry in self.dirs.items()
+        }
+        other.base_dirs = dict(self.base_dirs)
+        other.files = {kind: list(files) for kind, files in self.files.items()}
+        return other
+
+    def abspath(self, reldir):
+        return os.path.join(self.root, reldir) if reldir else self.root
+
+    def scan(self, cache=None, known=None, progress_callback=None, cancel_event=None, max_workers=SCAN_WORKERS):
+        """
+        Walk the tree level by level, listing sibling directories concurrently on a
+        pool of max_workers threads. Directories whose mtime is unchanged since the
+        last scan are taken from `known` (the dirs of a previous inventory) or from
+        the ScanCache instead of being listed.
+        progress_callback(dirs_seen, files_seen) is called after each directory; setting
+        cancel_event stops the walk and leaves `cancelled` set (the cache is not written).
+        """
+        self.dirs = {}
+        self.listed_dirs = 0
+        self.cached_dirs = 0
+        self.cancelled = False
+        files_seen = 0
+        cached = {}
+        if known is not None:
+            cached = known
+        elif cache is not None:
+            try:
+                cached = cache.load(self.root)
+            except Exception:
+                cached = {}
+        if self.root and os.path.isdir(self.root):
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+                level = [""]
+                while level:
+                    next_level = []
+                    results = pool.map(lambda reldir: self._scan_dir(reldir, cached.get(reldir)), level)
+                    for reldir, result in zip(level, results):
+                        if cancel_event is not None and cancel_event.is_set():
+                            self.cancelled = True
+                            pool.shutdown(wait=False, cancel_futures=True)
+                            return self
+                        if result is None:
+                            continue
+                        entry, from_cache = result
+                        if from_cache:
+                            self.cached_dirs += 1
+                        else:
+                            self.listed_dirs += 1
+                        self.dirs[reldir] = entry
+                        next_level.extend(os.path.join(reldir, d) for d in entry["subdirs"])
+                        files_seen += len(entry["pngs"])
+                        if progress_callback:
+                            progress_callback(len(self.dirs), files_seen)
+                    level = next_level
+        self._build_file_lists()
+        if cache is not None:
+            try:
+                cache.store(self.root, self.dirs)
+            except Exception:
+                pass
+        return self
+
+    def _scan_dir(self, reldir, cached_entry=None):
+        """Return (entry, from_cache), or None if the directory is gone. Runs on pool threads."""
+        try:
+            mtime_ns = os.stat(self.abspath(reldir)).st_mtime_ns
+        except OSError:
+            return None
+        if cached_entry is not None and cached_entry.get("mtime_ns") == mtime_ns:
+            return cached_entry, True
+        entry = self._list_dir(reldir)
+        entry["mtime_ns"] = mtime_ns
+        return entry, False
+
+    def _list_dir(self, reldir):
+        subdirs, pngs = [], []
+        try:
+            with os.scandir(self.abspath(reldir)) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir():
+                            subdirs.append(entry.name)
+                        elif entry.name.lower().endswith('.png'):
+                            pngs.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return {"subdirs": sorted(subdirs), "pngs": sorted(pngs)}
+
+    def _iter_tree(self, reldir):
+        """Yield reldir and every directory below it, depth-first in listing order (like os.walk)."""
+        stack = [reldir]
+        while stack:
+            current = stack.pop()
+            if current not in self.dirs:
+                continue
+            yield current
+            stack.extend(reversed([os.path.join(current, d) for d in self.dirs[current]["subdirs"]]))
+
+    def _build_file_lists(self):
+        self.base_dirs = {kind: None for kind in PNG_SUBFOLDERS}
+        for reldir in self._iter_tree(""):
+            for kind in PNG_SUBFOLDERS:
+                if self.base_dirs[kind] is None and kind in self.dirs[reldir]["subdirs"]:
+                    self.base_dirs[kind] = os.path.join(reldir, kind)
+        for kind in PNG_SUBFOLDERS:
+            base = self.base_dirs[kind]
+            files = []
+            if base is not None:
+                for reldir in self._iter_tree(base):
+                    sub = os.path.relpath(reldir, base) if reldir != base else ""
+                    files.extend(os.path.join(sub, f) if sub else f for f in self.dirs[reldir]["pngs"])
+            self.files[kind] = sorted(files)
+
+    def base_dir(self, kind):
+        base = self.base_dirs.get(kind)
+        return self.abspath(base) if base is not None else None
+
+    def relpaths(self, kind):
+        return self.files.get(kind, [])
+
+    def full_paths(self, kind):
+        base = self.base_dir(kind)
+        if base is None:
+            return []
+        return [os.path.join(base, f) for f in self.files[kind]]
+
+    def path(self, kind, index):
+        """Full path of the index-th file of a kind, in listbox order."""
+        return os.path.join(self.base_dir(kind), self.files[kind][index])
+
+    def index_of(self, kind, path):
+        """Position of path among the kind's files (binary search), or None."""
+        found_kind, rel = self.locate(path)
+        if found_kind != kind:
+            return None
+        files = self.files[kind]
+        idx = bisect.bisect_left(files, rel)
+        return idx if idx < len(files) and files[idx] == rel else None
+
+    def locate(self, path):
+        """Return (kind, path relative to the kind's folder) for a file, or (None, None)."""
+        for kind in PNG_SUBFOLDERS:
+            base = self.base_dir(kind)
+            if base is None:
+                continue
+            try:
+                rel = os.path.relpath(path, base)
+            except ValueError:
+                continue
+            if not rel.startswith(os.pardir) and not os.path.isabs(rel):
+                return kind, rel
+        return None, None
+
+    def add_file(self, path):
+        """Insert a PNG file. Returns (kind, relpath, index) or None if unknown or already present."""
+        if not path.lower().endswith('.png'):
+            return None
+        kind, rel = self.locate(path)
+        if kind is None:
+            return None
+        files = self.files[kind]
+        idx = bisect.bisect_left(files, rel)
+        if idx < len(files) and files[idx] == rel:
+            return None
+        files.insert(idx, rel)
+        entry = self.dirs.get(os.path.dirname(os.path.join(self.base_dirs[kind], rel)))
+        if entry is not None and os.path.basename(rel) not in entry["pngs"]:
+            bisect.insort(entry["pngs"], os.path.basename(rel))
+        return kind, rel, idx
+
+    def remove_file(self, path):
+        """Remove a PNG file. Returns (kind, relpath, index) or None if it was not indexed."""
+        kind, rel = self.locate(path)
+        if kind is None:
+            return None
+        files = self.files[kind]
+        idx = bisect.bisect_left(files, rel)
+        if idx >= len(files) or files[idx] != rel:
+            return None
+        del files[idx]
+        entry = self.dirs.get(os.path.dirname(os.path.join(self.base_dirs[kind], rel)))
+        if entry is not None and os.path.basename(rel) in entry["pngs"]:
+            entry["pngs"].remove(os.path.basename(rel))
+        return kind, rel, idx
+
+    def diff(self, previous):
+        """
+        Compare with a previous inventory. Returns, per kind, the full paths
+        'added' and 'removed', and 'renamed' (old, new) pairs for files that only
+        moved to another folder (same basename).
+        """
+        changes = {}
+        for kind in PNG_SUBFOLDERS:
+            old = set(previous.full_paths(kind)) if previous is not None else set()
+            new = set(self.full_paths(kind))
+            added = sorted(new - old)
+            removed = sorted(old - new)
+            removed_by_name = {}
+            for path in removed:
+                removed_by_name.setdefault(os.path.basename(path), []).append(path)
+            renamed = []
+            for path in added:
+                candidates = removed_by_name.get(os.path.basename(path))
+                if candidates:
+                    renamed.append((candidates.pop(0), path))
+            moved_old = {old_path for old_path, _ in renamed}
+            moved_new = {new_path for _, new_path in renamed}
+            changes[kind] = {
+                "added": [p for p in added if p not in moved_new],
+                "removed": [p for p in removed if p not in moved_old],
+                "renamed": renamed,
+            }
+        return changes
+
+
+class InventoryFiles(Sequence):
+    """
+    Live, ordered view of one kind's full paths in the current ImageInventory. The
+    listboxes, the image viewer and the galleries all index this one list, so row i
+    of a listbox is always item i here. get_inventory() is called on each access,
+    so the view follows rescans and incremental updates without copying.
+    """
+    def __init__(self, get_inventory, kind):
+        self.get_inventory = get_inventory
+        self.kind = kind
+
+    def __len__(self):
+        inventory = self.get_inventory()
+        return len(inventory.relpaths(self.kind)) if inventory.base_dir(self.kind) is not None else 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self.get_inventory().path(self.kind, index)
+
+    def index(self, path, *args):
+        idx = self.get_inventory().index_of(self.kind, path)
+        if idx is None:
+            raise ValueError(f"{path} is not in the {self.kind} files")
+        return idx
+
+
+class FolderWatcher:
+    """
+    Watch a Pictures folder for PNG files being created or deleted.
+    Uses watchdog (inotify on Linux) when it is installed, otherwise polls the folder
+    with ImageInventory, which only re-lists directories whose mtime changed.
+    Events are put on `events` as ("created" | "deleted", path); the GUI drains the queue.
+    """
+    def __init__(self, root, inventory=None, poll_interval=WATCH_POLL_SECONDS, backend="auto"):
+        self.root = root
+        self.events = queue.Queue()
+        self.poll_interval = poll_interval
+        self.backend = backend
+        self.mode = None
+        self._snapshot = inventory.copy() if inventory is not None else None
+        self._observer = None
+        self._stop = threading.Event()
+
+    def start(self):
+        if self.backend != "polling" and self._start_native():
+            self.mode = "native"
+        else:
+            threading.Thread(target=self._poll_loop, daemon=True).start()
+            self.mode = "polling"
+        return self
+
+    def _start_native(self):
+        try:
+            from watchdog.observers import Observer
+            from watchdog.events import FileSystemEventHandler
+        except ImportError:
+            return False
+        watcher = self
+
+        class Handler(FileSystemEventHandler):
+            def on_created(self, event):
+                if not event.is_directory:
+                    watcher._post("created", event.src_path)
+
+            def on_deleted(self, event):
+                if not event.is_directory:
+                    watcher._post("deleted", event.src_path)
+
+            def on_moved(self, event):
+                if not event.is_directory:
+                    watcher._post("deleted", event.src_path)
+                    watcher._post("created", event.dest_path)
+
+        try:
+            self._observer = Observer()
+            self._observer.schedule(Handler(), self.root, recursive=True)
+            self._observer.daemon = True
+            self._observer.start()
+        except Exception:
+            self._observer = None
+            return False
+        return True
+
+    def _post(self, action, path):
+        if path.lower().endswith('.png'):
+            self.events.put((action, path))
+
+    def _poll_loop(self):
+        snapshot = self._snapshot or ImageInventory(self.root).scan()
+        while not self._stop.wait(self.poll_interval):
+            current = ImageInventory(self.root).scan(known=snapshot.dirs)
+            for change in current.diff(snapshot).values():
+                for path in change["removed"]:
+                    self._post("deleted", path)
+                for old_path, new_path in change["renamed"]:
+                    self._post("deleted", old_path)
+                    self._post("created", new_path)
+                for path in change["added"]:
+                    self._post("created", path)
+            snapshot = current
+
+    def stop(self):
+        self._stop.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+
+
+class ProgressBus:
+    """
+    Hand-off of progress from worker threads to the Tk main loop.
+    post() keeps only the latest event per job, so a worker may post after every file;
+    the GUI drains the bus at a fixed rate and passes each event to the handler
+    subscribed for that job. call_soon() queues a one-off call (e.g. a job finishing)
+    to run on the Tk thread at the next drain.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latest = {}
+        self._calls = []
+        self._handlers = {}
+
+    def subscribe(self, job, handler):
+        self._handlers[job] = handler
+
+    def post(self, job, **event):
+        with self._lock:
+            self._latest[job] = event
+
+    def call_soon(self, func, *args):
+        with self._lock:
+            self._calls.append((func, args))
+
+    def drain(self, report_error=None, calls=True):
+        """
+        Deliver pending events and calls. Must run on the Tk thread. Each handler and
+        call runs on its own, so one that raises doesn't lose the rest of the batch;
+        the error goes to report_error(exc_type, exc, tb) (e.g. Tk's
+        report_callback_exception). With calls=False only progress events are
+        delivered and queued calls wait for the next full drain.
+        """
+        with self._lock:
+            latest, self._latest = self._latest, {}
+            if calls:
+                calls, self._calls = self._calls, []
+            else:
+                calls = []
+        for job, event in latest.items():
+            handler = self._handlers.get(job)
+            if handler:
+                self._run(report_error, handler, event)
+        for func, args in calls:
+            self._run(report_error, func, *args)
+
+    @staticmethod
+    def _run(report_error, func, *args):
+        try:
+            func(*args)
+        except Exception:
+            if report_error is None:
+                raise
+            report_error(*sys.exc_info())
+
+
+class CopyFilter:
+    """
+    Selective nav sync, applied while enumerating the sources: line folders, the
+    Deployment/Recovery subfolders, and a date window (inclusive, whole days) on the
+    timestamp parsed from each filename with a FilenameFormatPlan. Empty criteria
+    select everything; with a date window, files whose timestamp can't be parsed
+    are left out.
+    """
+    def __init__(self, lines=(), kinds=PNG_SUBFOLDERS, date_from=None, date_to=None,
+                 plan=None, date_fmt="%d%m%Y", time_fmt="%H%M%S"):
+        self.lines = set(lines)
+        self.kinds = set(kinds) or set(PNG_SUBFOLDERS)
+        self.date_from = date_from
+        self.date_to = date_to
+        self.plan = plan
+        self.date_fmt = date_fmt
+        self.time_fmt = time_fmt
+
+    @classmethod
+    def from_config(cls, filters, plan=None, date_fmt="%d%m%Y", time_fmt="%H%M%S"):
+        """Build from general["copy_filters"]; dates are 'YYYY-MM-DD' strings, invalid ones are ignored."""
+        def parse_day(value):
+            try:
+                return datetime.strptime(str(value).strip(), "%Y-%m-%d").date()
+            except ValueError:
+                return None
+
+        filters = filters or {}
+        return cls(
+            lines=filters.get("lines", []),
+            kinds=filters.get("kinds", PNG_SUBFOLDERS),
+            date_from=parse_day(filters.get("date_from", "")),
+            date_to=parse_day(filters.get("date_to", "")),
+            plan=plan, date_fmt=date_fmt, time_fmt=time_fmt,
+        )
+
+    @property
+    def has_date_window(self):
+        return (self.date_from is not None or self.date_to is not None) and self.plan is not None \
+            and self.plan.span("Date") is not None and self.plan.span("Time") is not None
+
+    @property
+    def is_active(self):
+        return bool(self.lines) or self.kinds != set(PNG_SUBFOLDERS) or self.has_date_window
+
+    def accepts_line(self, line_name):
+        return not self.lines or line_name in self.lines
+
+    def accepts_kind(self, kind):
+        return kind in self.kinds
+
+    def select_entries(self, entries):
+        """Keep the (name, size, mtime_ns) entries whose filename timestamp falls in the date window."""
+        if not entries or not self.has_date_window:
+            return entries
+        stamps = filename_timestamps([entry[0] for entry in entries], self.plan, self.date_fmt, self.time_fmt)
+        keep = ~np.isnat(stamps)
+        if self.date_from is not None:
+            keep &= stamps >= np.datetime64(self.date_from)
+        if self.date_to is not None:
+            keep &= stamps < np.datetime64(self.date_to + timedelta(days=1))
+        return [entry for entry, k in zip(entries, keep) if k]
+
+    def select_items(self, items):
+        """Keep the file dicts (line, kind, src, ...) the filter accepts, e.g. the journal of an earlier sync."""
+        items = [item for item in items if self.accepts_line(item["line"]) and self.accepts_kind(item["kind"])]
+        return [item for _, item in self.select_entries([(os.path.basename(item["src"]), item) for item in items])]
+
+    def describe(self):
+        parts = []
+        if self.lines:
+            parts.append("lines " + ", ".join(sorted(self.lines)))
+        if self.kinds != set(PNG_SUBFOLDERS):
+            parts.append(" / ".join(sorted(self.kinds)) + " only")
+        if self.has_date_window:
+            parts.append(f"{self.date_from or '...'} to {self.date_to or '...'}")
+        return "; ".join(parts) if parts else "all files"
+
+
+class CopyPriority:
+    """
+    Order of the nav copy queue: listed priority lines first (in the order given),
+    then, if newest_first, the newest filename timestamp first within each group.
+    Files whose timestamp can't be parsed go last; the sort is otherwise stable.
+    """
+    def __init__(self, lines=(), newest_first=False, plan=None, date_fmt="%d%m%Y", time_fmt="%H%M%S"):
+        self.lines = [line for line in lines if line]
+        self.newest_first = newest_first
+        self.plan = plan
+        self.date_fmt = date_fmt
+        self.time_fmt = time_fmt
+
+    @classmethod
+    def from_config(cls, priority, plan=None, date_fmt="%d%m%Y", time_fmt="%H%M%S"):
+        priority = priority or {}
+        return cls(
+            lines=priority.get("lines", []),
+            newest_first=bool(priority.get("newest_first", False)),
+            plan=plan, date_fmt=date_fmt, time_fmt=time_fmt,
+        )
+
+    def order(self, items):
+        """Return the copy items ({"line", "src", ...} dicts) in priority order."""
+        if not items or not (self.lines or self.newest_first):
+            return items
+        rank = {line: i for i, line in enumerate(self.lines)}
+        line_rank = np.array([rank.get(item["line"], len(rank)) for item in items])
+        stamps = None
+        if self.newest_first:
+            stamps = filename_timestamps([os.path.basename(item["src"]) for item in items],
+                                         self.plan, self.date_fmt, self.time_fmt)
+        if stamps is None:
+            keys = (line_rank,)
+        else:
+            parsed = ~np.isnat(stamps)
+            age = np.where(parsed, -stamps.astype("datetime64[s]").astype(np.int64), 0)
+            keys = (age, ~parsed, line_rank)  # np.lexsort: last key is the primary one
+        return [items[i] for i in np.lexsort(keys)]
+
+
+class CopyEngine:
+    """
+    Copy many files at once on a bounded pool of worker threads, so throughput over a
+    slow link is not limited by per-file latency. run() returns aggregate statistics.
+    Jobs are handed to the pool a few at a time, so setting stop_event (or calling
+    stop()) ends the run after the files already being copied, instead of leaving a
+    queue that the interpreter would still work through on exit.
+    """
+    def __init__(self, max_workers=COPY_WORKERS, copy_func=shutil.copy2, stop_event=None):
+        self.max_workers = max(1, int(max_workers))
+        self.copy_func = copy_func
+        self.stop_event = stop_event if stop_event is not None else threading.Event()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def _copy_one(self, src, dest):
+        if self.stop_event.is_set():
+            return None
+        self.copy_func(src, dest)
+        return os.path.getsize(dest)
+
+    def run(self, jobs, progress_callback=None, on_copied=None):
+        """
+        Copy (src, dest) pairs. Destination folders are created once up front.
+        progress_callback(files_done, files_total, bytes_done) and on_copied(src, dest)
+        are called from the thread running run() after each file.
+        Returns {"files", "bytes", "seconds", "mb_per_s", "files_per_s", "errors", "stopped"}.
+        """
+        jobs = list(jobs)
+        for folder in sorted({os.path.dirname(dest) for _, dest in jobs}):
+            os.makedirs(folder, exist_ok=True)
+        stats = {"files": 0, "bytes": 0, "seconds": 0.0, "mb_per_s": 0.0, "files_per_s": 0.0, "errors": []}
+        started = time.monotonic()
+        todo = iter(jobs)
+        futures = {}
+        done = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while True:
+                # Keep at most two jobs per worker queued
+                while len(futures) < 2 * self.max_workers and not self.stop_event.is_set():
+                    job = next(todo, None)
+                    if job is None:
+                        break
+                    futures[pool.submit(self._copy_one, *job)] = job
+                if not futures:
+                    break
+                finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    src, dest = futures.pop(future)
+                    try:
+                        nbytes = future.result()
+                        if nbytes is None:
+                            continue  # stopped before this file started
+                        stats["bytes"] += nbytes
+                        stats["files"] += 1
+                        if on_copied:
+                            on_copied(src, dest)
+                    except Exception as e:
+                        stats["errors"].append((src, str(e)))
+                    done += 1
+                    if progress_callback:
+                        progress_callback(done, len(jobs), stats["bytes"])
+        stats["stopped"] = self.stop_event.is_set()
+        stats["seconds"] = time.monotonic() - started
+        if stats["seconds"] > 0:
+            stats["mb_per_s"] = stats["bytes"] / (1024 * 1024) / stats["seconds"]
+            stats["files_per_s"] = stats["files"] / stats["seconds"]
+        return stats
+
+
+class ThumbnailGallery(ttk.Frame):
+    """
+    Scrollable grid of thumbnails that only draws what is in view. The scroll region
+    spans every row, but canvas items exist just for the visible tiles and are
+    dropped as they scroll out. Thumbnails are made lazily on a background pool with
+    load_thumbnail(path, box) and handed back through call_soon(func, *args), which
+    must run func on the Tk thread; the PhotoImages of recent tiles are kept in a
+    bounded LRU.
+    """
+    LABEL_HEIGHT = 18
+    GAP = 8
+
+    def __init__(self, master, load_thumbnail, call_soon, on_open=None,
+                 tile_size=GALLERY_TILE_SIZE, max_workers=GALLERY_WORKERS, **kwargs):
+        super().__init__(master, **kwargs)
+        self.load_thumbnail = load_thumbnail
+        self.call_soon = call_soon
+        self.on_open = on_open
+        self.tile_size = tile_size
+        self.tile_w = tile_size[0] + self.GAP
+        self.tile_h = tile_size[1] + self.LABEL_HEIGHT + self.GAP
+        self.files = []
+        self.columns = 1
+        self.selected = None
+        self._tiles = {}              # index -> (path, [canvas item ids])
+        self._photos = OrderedDict()  # path -> PhotoImage, least recently shown first
+        self._failed = set()
+        self._pending = set()
+        self._wanted = frozenset()    # paths in view; read by the workers to skip stale requests
+        self._closed = False
+        self._pool = ThreadPoolExecutor(max_workers=max(1, int(max_workers)))
+
+        self.canvas = tk.Canvas(self, background="white", highlightthickness=0, yscrollincrement=self.tile_h // 3)
+        self.vscroll = ttk.Scrollbar(self, orient="vertical", command=self._yview)
+        self.canvas.config(yscrollcommand=self.vscroll.set)
+        self.vscroll.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.canvas.bind("<Configure>", lambda e: self._relayout())
+        self.canvas.bind("<Button-1>", self._on_click)
+        self.canvas.bind("<MouseWheel>", lambda e: self._yview("scroll", -1 if e.delta > 0 else 1, "units"))
+        self.canvas.bind("<Button-4>", lambda e: self._yview("scroll", -1, "units"))
+        self.canvas.bind("<Button-5>", lambda e: self._yview("scroll", 1, "units"))
+        self.bind("<Destroy>", self._on_destroy)
+
+    def set_files(self, files):
+        """
+        Show a sequence of paths (it may be a live view such as InventoryFiles),
+        keeping the scroll position; cached thumbnails are reused.
+        """
+        self.files = files
+        if self.selected is not None and self.selected >= len(self.files):
+            self.selected = None
+        self._clear_tiles()
+        self._update_scrollregion()
+        self._render()
+
+    def select(self, index):
+        """Highlight the tile at index and scroll it into view."""
+        self.selected = index
+        if index is not None and 0 <= index < len(self.files):
+            rows = max(1, math.ceil(len(self.files) / self.columns))
+            row = index // self.columns
+            top, bottom = self.canvas.canvasy(0), self.canvas.canvasy(self.canvas.winfo_height())
+            if not (top <= row * self.tile_h and (row + 1) * self.tile_h <= bottom):
+                self.canvas.yview_moveto(row / rows)
+        self._clear_tiles()
+        self._render()
+
+    def _yview(self, *args):
+        self.canvas.yview(*args)
+        self._render()
+
+    def _relayout(self):
+        columns = max(1, self.canvas.winfo_width() // self.tile_w)
+        if columns != self.columns:
+            self.columns = columns
+            self._clear_tiles()
+            self._update_scrollregion()
+        self._render()
+
+    def _update_scrollregion(self):
+        rows = math.ceil(len(self.files) / self.columns)
+        self.canvas.config(scrollregion=(0, 0, self.columns * self.tile_w, max(rows * self.tile_h, 1)))
+
+    def _clear_tiles(self):
+        for _, items in self._tiles.values():
+            for item in items:
+                self.canvas.delete(item)
+        self._tiles.clear()
+
+    def _visible_range(self):
+        top = max(0.0, self.canvas.canvasy(0))
+        bottom = self.canvas.canvasy(self.canvas.winfo_height())
+        first = int(top // self.tile_h) * self.columns
+        last = min(len(self.files), (int(bottom // self.tile_h) + 1) * self.columns)
+        return range(first, max(first, last))
+
+    def _render(self):
+        visible = self._visible_range()
+        for index in [i for i in self._tiles if i not in visible]:
+            for item in self._tiles.pop(index)[1]:
+                self.canvas.delete(item)
+        self._wanted = frozenset(self.files[i] for i in visible)
+        for index in visible:
+            if index not in self._tiles:
+                self._draw_tile(index)
+
+    def _draw_tile(self, index):
+        path = self.files[index]
+        row, col = divmod(index, self.columns)
+        x = col * self.tile_w + self.GAP // 2
+        y = row * self.tile_h + self.GAP // 2
+        w, h = self.tile_size
+        items = [self.canvas.create_rectangle(
+            x - 2, y - 2, x + w + 2, y + h + 2,
+            outline="#1e6fd9" if index == self.selected else "#cccccc",
+            width=3 if index == self.selected else 1,
+        )]
+        name = os.path.basename(path)
+        if len(name) > 24:
+            name = "..." + name[-21:]
+        items.append(self.canvas.create_text(x + w // 2, y + h + self.LABEL_HEIGHT // 2 + 2, text=name, font=("TkDefaultFont", 8)))
+        photo = self._photos.get(path)
+        if photo is not None:
+            self._photos.move_to_end(path)
+            items.append(self.canvas.create_image(x + w // 2, y + h // 2, image=photo))
+        elif path in self._failed:
+            items.append(self.canvas.create_text(x + w // 2, y + h // 2, text="(unreadable)", fill="red"))
+        else:
+            self._request(path)
+        self._tiles[index] = (path, items)
+
+    def _request(self, path):
+        if path in self._pending:
+            return
+        self._pending.add(path)
+        self._pool.submit(self._load, path)
+
+    def _load(self, path):
+        # Worker thread: skip tiles scrolled out of view before their turn came
+        if self._closed or path not in self._wanted:
+            self.call_soon(self._pending.discard, path)
+            return
+        try:
+            img = self.load_thumbnail(path, self.tile_size)
+        except Exception:
+            img = None
+        self.call_soon(self._on_thumbnail, path, img)
+
+    def _on_thumbnail(self, path, img):
+        self._pending.discard(path)
+        if self._closed:
+            return
+        if img is None:
+            self._failed.add(path)
+        else:
+            self._photos[path] = ImageTk.PhotoImage(img)
+            while len(self._photos) > GALLERY_MEMORY_TILES:
+                self._photos.popitem(last=False)
+        for index, (tile_path, items) in list(self._tiles.items()):
+            if tile_path == path:
+                for item in items:
+                    self.canvas.delete(item)
+                del self._tiles[index]
+                self._draw_tile(index)
+
+    def _on_click(self, event):
+        col = int(self.canvas.canvasx(event.x) // self.tile_w)
+        row = int(self.canvas.canvasy(event.y) // self.tile_h)
+        index = row * self.columns + col
+        if col < self.columns and 0 <= index < len(self.files):
+            self.select(index)
+            if self.on_open:
+                self.on_open(index)
+
+    def _on_destroy(self, event):
+        if event.widget is self and not self._closed:
+            self._closed = True
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+
 class FilenameFormatDialog(ttk.LabelFrame):
     def __init__(
         self,
@@ -198,7 +1842,7 @@ class FilenameFormatDialog(ttk.LabelFrame):
         self.save_all_config = save_all_config
         self.get_deployment_png_filenames = get_deployment_png_filenames
         self.on_format_change = on_format_change
-        self.format_items = ["Line", "Point", "Index", "Bumper", "Date", "Time", "ROV"]
+        self.format_items = list(FILENAME_FIELDS)
         self.format_vars = {}
         self.format_entries = {}
         self.sample_labels = []
@@ -207,12 +1851,18 @@ class FilenameFormatDialog(ttk.LabelFrame):
         self.png_date_format_var = tk.StringVar()
         self.png_time_format_var = tk.StringVar()
         self.example_label = None
+        self.format_error_label = None
         self.initialized = False
         self.on_update_export_data = on_update_export_data
+        self._apply_after_id = None
+        self.plan = FilenameFormatPlan({}, {})
+        self.applied_plan = self.plan
         self.init_widgets()
         self.load_last_format_config()
         self.load_png_datetime_format()
         self.update_samples()
+        self._applied_format = self.get_current_format_config()
+        self.applied_plan = FilenameFormatPlan.compile(self._applied_format)
         self.initialized = True
         
 
@@ -256,6 +1906,7 @@ class FilenameFormatDialog(ttk.LabelFrame):
             start_entry.bind("<FocusIn>", lambda e, it=item: self._activate_field(it, "start"))
             start_entry.bind("<FocusOut>", lambda e, it=item: self._deactivate_field(it, "start"))
             start_entry.bind("<KeyRelease>", lambda e, it=item: self._validate_and_update(it, "start"))
+            start_entry.bind("<Return>", lambda e: self.apply_format())
             self.format_entries.setdefault(item, {})["start"] = start_entry
 
         ttk.Label(table_frame, text="Len").grid(row=2, column=0, padx=3, pady=2, sticky="e")
@@ -267,6 +1918,7 @@ class FilenameFormatDialog(ttk.LabelFrame):
             length_entry.bind("<FocusIn>", lambda e, it=item: self._activate_field(it, "length"))
             length_entry.bind("<FocusOut>", lambda e, it=item: self._deactivate_field(it, "length"))
             length_entry.bind("<KeyRelease>", lambda e, it=item: self._validate_and_update(it, "length"))
+            length_entry.bind("<Return>", lambda e: self.apply_format())
             self.format_entries.setdefault(item, {})["length"] = length_entry
 
         png_dt_frame = ttk.LabelFrame(right_frame, text="Filename Date/Time Format")
@@ -290,8 +1942,13 @@ class FilenameFormatDialog(ttk.LabelFrame):
             self._validate_and_update(item, "start")
             self._validate_and_update(item, "length")
 
-        # ttk.Button(left_frame, text="Save Format", command=self.save_current_format_config).grid(row=3, column=0, pady=8)
-        ttk.Button(left_frame, text="Update Export Data", command=self.on_update_export_data).grid(row=3, column=0, pady=8)
+        self.format_error_label = ttk.Label(left_frame, text="", foreground="red", anchor="w", justify="left")
+        self.format_error_label.grid(row=2, column=0, sticky="w", padx=2)
+
+        btns_frame = ttk.Frame(left_frame)
+        btns_frame.grid(row=3, column=0, pady=8)
+        ttk.Button(btns_frame, text="Apply Format", command=self.apply_format).pack(side="left", padx=2)
+        ttk.Button(btns_frame, text="Update Export Data", command=self._apply_and_update_export_data).pack(side="left", padx=2)
 
     def _activate_field(self, item, field):
         self.active_field = (item, field)
@@ -302,17 +1959,55 @@ class FilenameFormatDialog(ttk.LabelFrame):
         self.active_field = (None, None)
         self.update_samples()
         self._validate_and_update(item, field)
+        self.apply_format()
 
     def _validate_and_update(self, item, field):
-        entry = self.format_entries[item][field]
-        value = self.format_vars[item][field].get()
-        if value == "" or (value.isdigit() and int(value) >= 0):
-            entry.configure(background="white")
-        else:
-            entry.configure(background="#ffcccc")
+        # The sample preview follows every key press; re-parsing the file lists is debounced
         self.update_samples()
-        if self.initialized and self.on_format_change:
-            self.on_format_change()
+        self._schedule_apply()
+
+    def compile_plan(self):
+        """Compile the entries into self.plan and mark the fields it rejects."""
+        samples = self.get_deployment_png_filenames()[:3] if self.get_deployment_png_filenames else []
+        max_length = max((len(os.path.splitext(os.path.basename(f))[0]) for f in samples), default=None)
+        self.plan = FilenameFormatPlan.compile(self.get_current_format_config(), max_length=max_length)
+        for item in self.format_items:
+            for field in ("start", "length"):
+                if field in self.format_entries.get(item, {}):
+                    color = "#ffcccc" if item in self.plan.errors else "white"
+                    self.format_entries[item][field].configure(background=color)
+        if self.format_error_label is not None:
+            self.format_error_label.config(text=self.plan.describe_errors())
+        return self.plan
+
+    def _schedule_apply(self):
+        if not self.initialized:
+            return
+        if self._apply_after_id is not None:
+            self.after_cancel(self._apply_after_id)
+        self._apply_after_id = self.after(FORMAT_APPLY_DELAY_MS, self.apply_format)
+
+    def apply_format(self):
+        """Save the edited format and re-parse the cached filename lists, if it changed since the last apply."""
+        if self._apply_after_id is not None:
+            self.after_cancel(self._apply_after_id)
+            self._apply_after_id = None
+        if not self.initialized:
+            return
+        format_config = self.get_current_format_config()
+        if format_config == self._applied_format:
+            return
+        plan = self.compile_plan()
+        if not plan.is_valid:
+            # Keep parsing with the last valid format until the entries are fixed
+            return
+        self._applied_format = format_config
+        self.applied_plan = plan
+        self.save_current_format_config()
+
+    def _apply_and_update_export_data(self):
+        self.apply_format()
+        self.on_update_export_data()
 
     def save_current_format_config(self):
         format_config = {}
@@ -372,11 +2067,9 @@ class FilenameFormatDialog(ttk.LabelFrame):
         # Use a real (or sample) filename from user context
         filenames = self.get_deployment_png_filenames() if self.get_deployment_png_filenames else []
         sample_fname = os.path.splitext(os.path.basename(filenames[0]))[0] if filenames else "20240529_143501_..."
-        format_config = self.get_current_format_config()
         date_fmt = self.png_date_format_var.get() or self.app_config.get("defaults", {}).get("png_date_format", "%d%m%Y")
         time_fmt = self.png_time_format_var.get() or self.app_config.get("defaults", {}).get("png_time_format", "%H%M%S")
-        # NOTE: you must provide extract_date_time_from_filename externally
-        dt = extract_date_time_from_filename(sample_fname, format_config, date_fmt, time_fmt)
+        dt = extract_date_time_from_filename(sample_fname, self.plan, date_fmt, time_fmt)
         now = datetime.now()
         ten_years = timedelta(days=365 * 10)
         error_message = ""
@@ -391,9 +2084,9 @@ class FilenameFormatDialog(ttk.LabelFrame):
             self.example_label.config(text=example, background="", foreground="blue")
 
     def update_samples(self):
+        self.compile_plan()
         filenames = self.get_deployment_png_filenames()[:3] if self.get_deployment_png_filenames else []
         self.last_png_samples = filenames
-        format_config = self.get_current_format_config()
         active_item, active_field = self.active_field
         for i, lbl in enumerate(self.sample_labels):
             lbl.config(state="normal")
@@ -401,17 +2094,10 @@ class FilenameFormatDialog(ttk.LabelFrame):
             if i < len(filenames):
                 fname = os.path.splitext(os.path.basename(filenames[i]))[0]
                 lbl.insert("1.0", fname)
-                if active_item is not None:
-                    start = format_config[active_item].get("start", "")
-                    length = format_config[active_item].get("length", "")
-                    try:
-                        s = int(start)
-                        l = int(length)
-                        if s >= 0 and l > 0 and s < len(fname):
-                            e = min(s + l, len(fname))
-                            lbl.tag_add("highlight", f"1.{s}", f"1.{e}")
-                    except Exception:
-                        pass
+                span = self.plan.span(active_item) if active_item is not None else None
+                if span is not None and span[0] < len(fname):
+                    s, l = span
+                    lbl.tag_add("highlight", f"1.{s}", f"1.{min(s + l, len(fname))}")
                 lbl.tag_configure("highlight", background="#ffff00")
             lbl.config(state="disabled")
         self.update_example_conversion()
@@ -508,8 +2194,32 @@ class App(tk.Tk):
         self.deployment_df = pd.DataFrame()
         self.recovery_df = pd.DataFrame()
         self.export_df = pd.DataFrame()
+        self.inventory = ImageInventory()
+        try:
+            self.scan_cache = ScanCache(SCAN_CACHE_FILE)
+        except Exception:
+            self.scan_cache = None
+        try:
+            self.thumbnail_cache = ThumbnailCache(
+                THUMBNAIL_CACHE_FILE, int(self.general.get("thumbnail_cache_mb", THUMBNAIL_CACHE_MAX_MB)) * 1024 * 1024
+            )
+        except Exception:
+            self.thumbnail_cache = None
+        self.folder_watcher = None
+        self._watch_drain_after_id = None
+        self._scan_job = None
+        self.last_copy_stats = None
+        self.copy_limiter = RateLimiter()
+        self.copy_stop = threading.Event()
+        self._copy_engine = None
+        self._copy_running = False
+        self._background_sync_after_id = None
+        self.progress_bus = ProgressBus()
+        self._last_progress_pump = 0.0
         self.notebook = ttk.Notebook(self)
         self.notebook.pack(fill="both", expand=True)
+        self.status_var = tk.StringVar(value="")
+        ttk.Label(self, textvariable=self.status_var, anchor="w").pack(side="bottom", fill="x", padx=10, pady=(0, 4))
         self.tab_images = ttk.Frame(self.notebook)
         self.tab_csv = ttk.Frame(self.notebook)
         self.tab_process = ttk.Frame(self.notebook)
@@ -517,102 +2227,131 @@ class App(tk.Tk):
         self.notebook.add(self.tab_csv, text="CSV File")
         self.notebook.add(self.tab_process, text="Process & Export")
         self.image_viewer_window = None
+        self.gallery_windows = {}
+        self.image_files = {kind: InventoryFiles(lambda: self.inventory, kind) for kind in PNG_SUBFOLDERS}
+        self.image_viewer_path = None
+        self.viewer_prefetcher = PreviewPrefetcher(
+            self.load_preview_image,
+            VIEWER_IMAGE_SIZE,
+            max_bytes=int(self.general.get("viewer_cache_mb", VIEWER_CACHE_MB)) * 1024 * 1024,
+        )
         self.image_viewer_image_label = None
         self.image_viewer_img = None
         self.image_viewer_files = []
         self.image_viewer_index = 0
         self.image_viewer_source = None
+        self.progress_bus.subscribe("scan", self._on_scan_progress)
+        self.progress_bus.subscribe("copy", self._on_copy_progress)
+        self.progress_bus.subscribe("parse", self._on_status_progress)
+        self.progress_bus.subscribe("export", self._on_status_progress)
         self.init_tab_images()
         self.init_tab_csv()
         self.init_tab_process()
         self.load_last_choices()
+        self.after(PROGRESS_DRAIN_MS, self._drain_progress_bus)
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
                 # --- Excel Export Section ---
         self.excel_filename_var = tk.StringVar()
         self.excel_col_map_vars = {}  # {excel_col: tk.StringVar}
         self.excel_cols = []
         self.excel_file_chosen = False
 
+    def on_close(self):
+        """
+        Stop background work before the window goes away: files of a running sync that
+        have not started are skipped (the next sync resumes them from the journal),
+        viewer prefetching is cancelled and the folder watcher stopped.
+        """
+        self.copy_stop.set()
+        engine = self._copy_engine
+        if engine is not None:
+            engine.stop()
+        self.viewer_prefetcher.close()
+        self.stop_folder_watch()
+        self.destroy()
+
+    # ---------- PROGRESS ----------
+    def _drain_progress_bus(self):
+        try:
+            self.progress_bus.drain(report_error=self.report_callback_exception)
+        finally:
+            self.after(PROGRESS_DRAIN_MS, self._drain_progress_bus)
+
+    def _pump_progress(self):
+        """
+        Show the latest progress from a long-running loop on the Tk thread, at most every
+        PROGRESS_DRAIN_MS. Queued calls (scan results, copy completion, dialogs) are left
+        to the regular drain so they can't change state in the middle of the loop.
+        """
+        now = time.monotonic()
+        if now - self._last_progress_pump >= PROGRESS_DRAIN_MS / 1000:
+            self._last_progress_pump = now
+            self.progress_bus.drain(report_error=self.report_callback_exception, calls=False)
+            self.update_idletasks()
+
+    def _on_status_progress(self, event):
+        message = event.get("message", "")
+        if event.get("total"):
+            message += f" {event['current']}/{event['total']}"
+        self.status_var.set(message)
+
     # ---------- PNG FORMAT PARSER UTILS ----------
-    def parse_filename_fields(self, fname, format_config):
-        basename = os.path.splitext(os.path.basename(fname))[0]
-        result = {}
-        for field in ["Line", "Point", "Index", "Bumper", "Date", "Time", "ROV"]:
-            conf = format_config.get(field, {})
-            start = conf.get("start")
-            length = conf.get("length")
-            if start is None or length is None or not start.isdigit() or not length.isdigit():
-                result[field] = None
-                continue
-            s = int(start)
-            l = int(length)
-            result[field] = basename[s:s+l] if s < len(basename) else ""
-        return result
-
-    def filelist_to_dataframe(self, files, format_config, png_datetime_format):
-        rows = []
-        for f in files:
-            info = self.parse_filename_fields(f, format_config)
-            if info is not None:
-                row = {**info}
-                row['filename'] = os.path.basename(f)
-                rows.append(row)
-        df = pd.DataFrame(rows)
-        if "Date" in df.columns and "Time" in df.columns:
-            date_fmt = png_datetime_format.get("date_format", self.app_config["defaults"].get("png_date_format", "%d%m%Y"))
-            time_fmt = png_datetime_format.get("time_format", self.app_config["defaults"].get("png_time_format", "%H%M%S"))
-            df["Date"] = df["Date"].fillna("")
-            df["Time"] = df["Time"].fillna("")
-            dt_str = df["Date"].astype(str) + df["Time"].astype(str)
-            mask = (df["Date"].str.len() == len("20240529")) & (df["Time"].str.len() == len("143501"))
-            try:
-                dt_vals = pd.to_datetime(dt_str.where(mask), format=date_fmt + time_fmt, errors="coerce")
-            except Exception:
-                dt_vals = pd.NaT
-            df["Datetime"] = dt_vals
-            df = df.drop(columns=["Date", "Time"])
-        return df
+    def filelist_to_dataframe(self, files, plan, png_datetime_format):
+        # Rows are indexed by full path so an incremental refresh can drop/rename single files
+        date_fmt = png_datetime_format.get("date_format", self.app_config["defaults"].get("png_date_format", "%d%m%Y"))
+        time_fmt = png_datetime_format.get("time_format", self.app_config["defaults"].get("png_time_format", "%H%M%S"))
+        return filename_fields_frame(files, plan, (date_fmt, time_fmt))
 
     def try_update_deployment_recovery_dataframes(self):
         image_dir = self.general.get("image_dir", "")
-        format_dialog_ready = hasattr(self, "format_dialog") and getattr(self.format_dialog, "get_current_format_config", None)
-        filename_format_defined = format_dialog_ready and self.format_dialog.get_current_format_config()
         if image_dir and os.path.isdir(image_dir):
             self.populate_deployment_recovery_lists(image_dir)
-            if filename_format_defined:
-                self.update_deployment_recovery_dataframes()
-
-    def update_deployment_recovery_dataframes(self):
-        if not hasattr(self, "format_dialog"):
-            return
-        format_config = self.format_dialog.get_current_format_config()
-
-        def find_png_files(subfolder_name, base_folder):
-            results = []
-            for root, dirs, _ in os.walk(base_folder):
-                if subfolder_name in dirs:
-                    target_dir = os.path.join(root, subfolder_name)
-                    for dp, dn, filenames in os.walk(target_dir):
-                        results.extend(
-                            os.path.join(dp, f)
-                            for f in filenames
-                            if f.lower().endswith('.png')
-                        )
-                    break
-            return results
 
-        folder = self.image_dir_var.get()
-        deployment_files, recovery_files = [], []
-        if folder and os.path.isdir(folder):
-            deployment_files = find_png_files("Deployment", folder)
-            recovery_files = find_png_files("Recovery", folder)
-
-        format_config = self.format_dialog.get_current_format_config()
+    def get_png_formats(self):
+        """The last applied FilenameFormatPlan and the PNG date/time formats."""
         png_datetime_format = {
             "date_format": self.format_dialog.png_date_format_var.get(),
             "time_format": self.format_dialog.png_time_format_var.get(),
         }
-        self.deployment_df = self.filelist_to_dataframe(deployment_files, format_config, png_datetime_format)
-        self.recovery_df = self.filelist_to_dataframe(recovery_files, format_config, png_datetime_format)
+        return self.format_dialog.applied_plan, png_datetime_format
+
+    def update_deployment_recovery_dataframes(self):
+        if not hasattr(self, "format_dialog"):
+            return
+        plan, png_datetime_format = self.get_png_formats()
+        started = time.monotonic()
+        self.deployment_df = self.filelist_to_dataframe(self.inventory.full_paths("Deployment"), plan, png_datetime_format)
+        self.recovery_df = self.filelist_to_dataframe(self.inventory.full_paths("Recovery"), plan, png_datetime_format)
+        self.progress_bus.post(
+            "parse",
+            message=f"Parsed {len(self.deployment_df)} Deployment / {len(self.recovery_df)} Recovery filenames "
+                    f"in {time.monotonic() - started:.2f} s."
+        )
+
+    def apply_inventory_changes(self, changes):
+        """
+        Update deployment_df/recovery_df in place from an ImageInventory.diff():
+        removed rows are dropped, moved rows re-indexed and only added files parsed.
+        """
+        if not hasattr(self, "format_dialog"):
+            return
+        plan, png_datetime_format = self.get_png_formats()
+        parsed = 0
+        for kind, attr in (("Deployment", "deployment_df"), ("Recovery", "recovery_df")):
+            change = changes.get(kind)
+            if not change:
+                continue
+            df = getattr(self, attr)
+            if change["removed"]:
+                df = df.drop(index=change["removed"], errors="ignore")
+            if change["renamed"]:
+                df = df.rename(index=dict(change["renamed"]))
+            if change["added"]:
+                new_df = self.filelist_to_dataframe(change["added"], plan, png_datetime_format)
+                df = new_df if df.empty else pd.concat([df, new_df])
+                parsed += len(new_df)
+            setattr(self, attr, df.sort_index())
+        self.progress_bus.post("parse", message=f"Parsed {parsed} new filenames.")
 
     # ---------- IMAGES TAB ----------
     def init_tab_images(self):
@@ -626,6 +2365,8 @@ class App(tk.Tk):
         ttk.Label(self.nav_dir_frame, text="Nav Image Folder:").pack(side="left")
         ttk.Entry(self.nav_dir_frame, textvariable=self.nav_image_dir_var, width=60, state="readonly").pack(side="left", padx=5)
         ttk.Button(self.nav_dir_frame, text="Choose...", command=self.choose_nav_image_folder).pack(side="left")
+        ttk.Button(self.nav_dir_frame, text="Copy Filters...", command=self.open_copy_filters_dialog).pack(side="left", padx=(10, 0))
+        ttk.Button(self.nav_dir_frame, text="Plan Copy...", command=self.plan_nav_images_copy).pack(side="left", padx=(10, 0))
         ttk.Button(self.nav_dir_frame, text="Copy Nav Images to Pictures Folder", command=self.copy_nav_images_to_pictures).pack(side="left", padx=(10, 0))
         self.copy_progress_var = tk.DoubleVar(value=0)
         self.copy_progress = ttk.Progressbar(
@@ -634,9 +2375,23 @@ class App(tk.Tk):
         )
         self.copy_progress.pack(side="left", padx=(10, 0))
 
+        ttk.Label(self.nav_dir_frame, text="Limit MB/s:").pack(side="left", padx=(10, 0))
+        self.copy_rate_limit_var = tk.StringVar(value=str(self.general.get("copy_rate_limit_mb_s", 0)))
+        ttk.Spinbox(
+            self.nav_dir_frame, from_=0, to=1000, increment=0.5, width=6, textvariable=self.copy_rate_limit_var
+        ).pack(side="left", padx=(2, 0))
+        self.copy_rate_limit_var.trace_add("write", lambda *args: self.apply_copy_rate_limit())
+        self.apply_copy_rate_limit()
+        self.background_sync_var = tk.BooleanVar(value=self.general.get("background_sync", False))
+        ttk.Checkbutton(
+            self.nav_dir_frame, text="Background sync", variable=self.background_sync_var, command=self.toggle_background_sync
+        ).pack(side="left", padx=(10, 0))
+
         self.copied_message_var = tk.StringVar(value="")
         self.copied_message_label = ttk.Label(self.nav_dir_frame, textvariable=self.copied_message_var)
         self.copied_message_label.pack(side="left", padx=(10, 0))
+        if self.background_sync_var.get():
+            self._schedule_background_sync()
 
         dir_frame = ttk.Frame(frm)
         dir_frame.pack(fill="x")
@@ -644,6 +2399,21 @@ class App(tk.Tk):
         ttk.Entry(dir_frame, textvariable=self.image_dir_var, width=60, state="readonly").pack(side="left", padx=5)
         ttk.Button(dir_frame, text="Choose...", command=self.choose_image_folder).pack(side="left")
         ttk.Button(dir_frame, text="Refresh", command=self.refresh_png_views).pack(side="left", padx=(10, 0))
+        self.watch_folder_var = tk.BooleanVar(value=self.general.get("watch_pictures_folder", False))
+        ttk.Checkbutton(dir_frame, text="Watch folder", variable=self.watch_folder_var, command=self.toggle_folder_watch).pack(side="left", padx=(10, 0))
+        self.scan_progress = ttk.Progressbar(dir_frame, orient="horizontal", length=120, mode="indeterminate")
+        self.scan_progress.pack(side="left", padx=(10, 0))
+        self.scan_cancel_button = ttk.Button(dir_frame, text="Cancel", command=self.cancel_folder_scan, state="disabled")
+        self.scan_cancel_button.pack(side="left", padx=(5, 0))
+        self.scan_status_var = tk.StringVar(value="")
+        ttk.Label(dir_frame, textvariable=self.scan_status_var).pack(side="left", padx=(10, 0))
+
+        gallery_frame = ttk.Frame(frm)
+        gallery_frame.pack(fill="x", pady=(6, 0))
+        for kind in PNG_SUBFOLDERS:
+            ttk.Button(
+                gallery_frame, text=f"{kind} Thumbnails...", command=lambda k=kind: self.open_thumbnail_gallery(k)
+            ).pack(side="left", padx=(0, 10))
 
         bottom_frame = ttk.Frame(frm)
         bottom_frame.pack(fill="both", expand=True, pady=10)
@@ -672,48 +2442,132 @@ class App(tk.Tk):
 
         self.try_update_deployment_recovery_dataframes()
 
+    def start_folder_scan(self, folder, on_done, known=None):
+        """
+        Scan folder into a new ImageInventory on a worker thread. Progress and the
+        result come back through the progress bus; on_done(inventory) runs on the
+        Tk thread unless the scan is cancelled or superseded.
+        """
+        self.cancel_folder_scan(quiet=True)
+        job = {"cancel": threading.Event(), "on_done": on_done}
+        self._scan_job = job
+
+        def run_scan():
+            inventory = ImageInventory(folder).scan(
+                cache=self.scan_cache,
+                known=known,
+                progress_callback=lambda dirs, files: self.progress_bus.post("scan", job=job, dirs=dirs, files=files),
+                cancel_event=job["cancel"],
+                max_workers=int(self.general.get("scan_workers", SCAN_WORKERS)),
+            )
+            self.progress_bus.call_soon(self._on_folder_scan_done, job, inventory)
+
+        threading.Thread(target=run_scan, daemon=True).start()
+        self.scan_status_var.set("Scanning...")
+        self.scan_cancel_button.config(state="normal")
+        self.scan_progress.start(50)
+
+    def _on_scan_progress(self, event):
+        if event["job"] is self._scan_job:
+            self.scan_status_var.set(f"Scanning... {event['dirs']} folders, {event['files']} PNG files")
+
+    def _on_folder_scan_done(self, job, inventory):
+        if job is not self._scan_job:
+            return
+        self._scan_job = None
+        self.scan_progress.stop()
+        self.scan_cancel_button.config(state="disabled")
+        if inventory.cancelled:
+            self.scan_status_var.set("Scan cancelled.")
+            return
+        self.scan_status_var.set(
+            f"{len(inventory.relpaths('Deployment'))} Deployment / {len(inventory.relpaths('Recovery'))} Recovery PNG files "
+            f"({inventory.listed_dirs} folders listed, {inventory.cached_dirs} unchanged)."
+        )
+        job["on_done"](inventory)
+
+    def cancel_folder_scan(self, quiet=False):
+        job = self._scan_job
+        if job is None:
+            return
+        job["cancel"].set()
+        self._scan_job = None
+        self.scan_progress.stop()
+        self.scan_cancel_button.config(state="disabled")
+        if not quiet:
+            self.scan_status_var.set("Scan cancelled.")
+
     def populate_deployment_recovery_lists(self, folder):
-        deployment_path = None
-        recovery_path = None
-        for root, dirs, files in os.walk(folder):
-            for d in dirs:
-                if d == "Deployment" and deployment_path is None:
-                    deployment_path = os.path.join(root, d)
-                if d == "Recovery" and recovery_path is None:
-                    recovery_path = os.path.join(root, d)
-        self.deployment_listbox.delete(0, tk.END)
-        if deployment_path and os.path.isdir(deployment_path):
-            pngs = self.list_png_files_recursive(deployment_path)
-            if pngs:
-                for fname in pngs:
-                    self.deployment_listbox.insert(tk.END, fname)
-                maxlen = max((len(f) for f in pngs), default=40)
-                self.deployment_listbox.config(width=max(40, min(maxlen, 200)))
-            else:
-                self.deployment_listbox.insert(tk.END, "No PNG files found in 'Deployment'")
-                self.deployment_listbox.config(width=40)
-        else:
-            self.deployment_listbox.insert(tk.END, "'Deployment' subdirectory not found")
-            self.deployment_listbox.config(width=40)
+        self.start_folder_scan(folder, self._on_folder_scanned)
 
-        self.recovery_listbox.delete(0, tk.END)
-        if recovery_path and os.path.isdir(recovery_path):
-            pngs = self.list_png_files_recursive(recovery_path)
+    def _on_folder_scanned(self, inventory):
+        self.inventory = inventory
+        self.fill_deployment_recovery_listboxes()
+        if hasattr(self, "format_dialog"):
+            self.format_dialog.update_samples()
+        self.update_deployment_recovery_dataframes()
+        self._ensure_folder_watch()
+
+    def fill_deployment_recovery_listboxes(self):
+        for kind, listbox in (("Deployment", self.deployment_listbox), ("Recovery", self.recovery_listbox)):
+            listbox.delete(0, tk.END)
+            if self.inventory.base_dir(kind) is None:
+                listbox.insert(tk.END, f"'{kind}' subdirectory not found")
+                listbox.config(width=40)
+                continue
+            pngs = self.inventory.relpaths(kind)
             if pngs:
-                for fname in pngs:
-                    self.recovery_listbox.insert(tk.END, fname)
+                listbox.insert(tk.END, *pngs)
                 maxlen = max((len(f) for f in pngs), default=40)
-                self.recovery_listbox.config(width=max(40, min(maxlen, 200)))
+                listbox.config(width=max(40, min(maxlen, 200)))
             else:
-                self.recovery_listbox.insert(tk.END, "No PNG files found in 'Recovery'")
-                self.recovery_listbox.config(width=40)
-        else:
-            self.recovery_listbox.insert(tk.END, "'Recovery' subdirectory not found")
-            self.recovery_listbox.config(width=40)
+                listbox.insert(tk.END, f"No PNG files found in '{kind}'")
+                listbox.config(width=40)
+        self.on_inventory_changed()
+
+    def open_thumbnail_gallery(self, kind):
+        gallery = self.gallery_windows.get(kind)
+        if gallery is not None and gallery.winfo_exists():
+            gallery.winfo_toplevel().lift()
+            return
+        win = tk.Toplevel(self)
+        win.title(f"{kind} Thumbnails")
+        win.geometry("900x650")
+        gallery = ThumbnailGallery(
+            win,
+            load_thumbnail=self.load_preview_image,
+            call_soon=self.progress_bus.call_soon,
+            on_open=lambda index: self.open_image_viewer(self.image_files[kind], index, kind.lower()),
+            max_workers=int(self.general.get("gallery_workers", GALLERY_WORKERS)),
+        )
+        gallery.pack(fill="both", expand=True)
+        gallery.set_files(self.image_files[kind])
+        self.gallery_windows[kind] = gallery
 
-        if hasattr(self, "format_dialog"):
-            self.format_dialog.update_samples()
-        self.update_deployment_recovery_dataframes()
+        def on_close():
+            self.gallery_windows.pop(kind, None)
+            win.destroy()
+        win.protocol("WM_DELETE_WINDOW", on_close)
+
+    def on_inventory_changed(self):
+        """Redraw open galleries and keep the viewer on its file after a scan or file events."""
+        for kind, gallery in self.gallery_windows.items():
+            gallery.set_files(self.image_files[kind])
+        self._resync_image_viewer()
+
+    def _resync_image_viewer(self):
+        """Re-find the viewer's current file by path; if it is gone, show its neighbour."""
+        if self.image_viewer_window is None or not isinstance(self.image_viewer_files, InventoryFiles):
+            return
+        files = self.image_viewer_files
+        try:
+            self.image_viewer_index = files.index(self.image_viewer_path)
+        except ValueError:
+            if not len(files):
+                return
+            self.image_viewer_index = min(self.image_viewer_index, len(files) - 1)
+            self.update_image_viewer()
+        self._select_in_listbox(self.image_viewer_source, self.image_viewer_index)
 
     def choose_image_folder(self):
         initial_dir = self.general.get("image_dir", "")
@@ -727,6 +2581,120 @@ class App(tk.Tk):
             self.save_all_config()
             self.populate_deployment_recovery_lists(folder)
 
+    def toggle_folder_watch(self):
+        self.general["watch_pictures_folder"] = self.watch_folder_var.get()
+        self.save_all_config()
+        if self.watch_folder_var.get():
+            self.start_folder_watch()
+            if self.folder_watcher is not None:
+                self.scan_status_var.set(f"Watching folder ({self.folder_watcher.mode}).")
+        else:
+            self.stop_folder_watch()
+            self.scan_status_var.set("")
+
+    def _ensure_folder_watch(self):
+        if not self.watch_folder_var.get():
+            return
+        if self.folder_watcher is None or self.folder_watcher.root != self.inventory.root:
+            self.start_folder_watch()
+
+    def start_folder_watch(self):
+        self.stop_folder_watch()
+        folder = self.image_dir_var.get()
+        if not (folder and os.path.isdir(folder)):
+            return
+        self.folder_watcher = FolderWatcher(
+            folder,
+            inventory=self.inventory if self.inventory.root == folder else None,
+            poll_interval=float(self.general.get("watch_poll_seconds", WATCH_POLL_SECONDS)),
+            backend=self.general.get("watch_backend", "auto"),
+        ).start()
+        self._watch_drain_after_id = self.after(WATCH_DRAIN_MS, self._drain_watch_events)
+
+    def stop_folder_watch(self):
+        if self._watch_drain_after_id is not None:
+            self.after_cancel(self._watch_drain_after_id)
+            self._watch_drain_after_id = None
+        if self.folder_watcher is not None:
+            self.folder_watcher.stop()
+            self.folder_watcher = None
+
+    def _drain_watch_events(self):
+        self._watch_drain_after_id = None
+        watcher = self.folder_watcher
+        if watcher is None:
+            return
+        events = []
+        try:
+            while True:
+                events.append(watcher.events.get_nowait())
+        except queue.Empty:
+            pass
+        if events:
+            self.ingest_file_events(events)
+        if watcher is not self.folder_watcher or self._watch_drain_after_id is not None:
+            return  # the watch was stopped or restarted meanwhile; the new one has its own timer
+        self._watch_drain_after_id = self.after(WATCH_DRAIN_MS, self._drain_watch_events)
+
+    def ingest_file_events(self, events):
+        """
+        Apply ("created" | "deleted", path) events to the inventory, the listboxes
+        and the parsed dataframes without rescanning the folder.
+        """
+        changes = {kind: {"added": [], "removed": [], "renamed": []} for kind in PNG_SUBFOLDERS}
+        unplaced = False
+        for action, path in events:
+            if action == "created":
+                result = self.inventory.add_file(path)
+            else:
+                result = self.inventory.remove_file(path)
+            if result is None:
+                unplaced = unplaced or self.inventory.locate(path)[0] is None
+                continue
+            kind, rel, idx = result
+            listbox = self.deployment_listbox if kind == "Deployment" else self.recovery_listbox
+            change = changes[kind]
+            if action == "created":
+                if len(self.inventory.relpaths(kind)) == 1:
+                    listbox.delete(0, tk.END)  # drop the "No PNG files found" placeholder
+                listbox.insert(idx, rel)
+                change["added"].append(path)
+            else:
+                listbox.delete(idx)
+                self.viewer_prefetcher.discard(path)
+                if not self.inventory.relpaths(kind):
+                    listbox.insert(tk.END, f"No PNG files found in '{kind}'")
+                if path in change["added"]:
+                    change["added"].remove(path)
+                else:
+                    change["removed"].append(path)
+        if any(c["added"] or c["removed"] for c in changes.values()):
+            self.apply_inventory_changes(changes)
+            self.on_inventory_changed()
+            if changes["Deployment"]["added"] or changes["Deployment"]["removed"]:
+                if hasattr(self, "format_dialog"):
+                    self.format_dialog.update_samples()
+        if unplaced and None in self.inventory.base_dirs.values():
+            # A Deployment/Recovery folder may just have been created
+            self.refresh_png_views()
+
+    def ingest_copied_files(self, pictures_folder, paths, live=False):
+        """
+        Add freshly copied destination files to the inventory, listboxes and parsed
+        dataframes directly, so the update costs as much as the copy, not a rescan.
+        Falls back to a full scan if the inventory is for another folder or is being
+        rebuilt; live batches sent while the copy runs are skipped in that case and
+        left to the final call.
+        """
+        if not paths:
+            return
+        same_root = bool(self.inventory.root) and os.path.normpath(self.inventory.root) == os.path.normpath(pictures_folder)
+        if not same_root or self._scan_job is not None:
+            if not live:
+                self.try_update_deployment_recovery_dataframes()
+            return
+        self.ingest_file_events([("created", path) for path in paths])
+
     def choose_nav_image_folder(self):
         initial_dir = self.general.get("nav_image_dir", "")
         folder = filedialog.askdirectory(
@@ -738,148 +2706,552 @@ class App(tk.Tk):
             self.general["nav_image_dir"] = folder
             self.save_all_config()
 
-    def copy_nav_images_to_pictures(self):
+    def _copy_filename_formats(self):
+        """(plan, date_fmt, time_fmt) used to date nav files, captured on the Tk thread."""
+        plan, png_datetime_format = self.get_png_formats() if hasattr(self, "format_dialog") else (None, {})
+        return (
+            plan,
+            png_datetime_format.get("date_format") or self.app_config["defaults"].get("png_date_format", "%d%m%Y"),
+            png_datetime_format.get("time_format") or self.app_config["defaults"].get("png_time_format", "%H%M%S"),
+        )
+
+    def get_copy_filter(self):
+        """CopyFilter from general["copy_filters"], dating files with the applied filename format."""
+        plan, date_fmt, time_fmt = self._copy_filename_formats()
+        return CopyFilter.from_config(self.general.get("copy_filters", {}), plan, date_fmt, time_fmt)
+
+    def get_copy_priority(self):
+        """CopyPriority from general["copy_priority"]."""
+        plan, date_fmt, time_fmt = self._copy_filename_formats()
+        return CopyPriority.from_config(self.general.get("copy_priority", {}), plan, date_fmt, time_fmt)
+
+    def open_copy_filters_dialog(self):
+        filters = self.general.get("copy_filters", {})
+        win = tk.Toplevel(self)
+        win.title("Copy Filters and Order")
+        win.transient(self)
+
+        ttk.Label(win, text="Lines (none selected = all lines):").grid(row=0, column=0, columnspan=2, sticky="w", padx=10, pady=(10, 2))
+        lines_listbox = tk.Listbox(win, selectmode="multiple", height=10, exportselection=False)
+        lines_listbox.grid(row=1, column=0, columnspan=2, sticky="nsew", padx=10)
         nav_folder = self.nav_image_dir_var.get()
-        pictures_folder = self.image_dir_var.get()
-        if not (nav_folder and os.path.isdir(nav_folder) and pictures_folder and os.path.isdir(pictures_folder)):
-            messagebox.showerror("Error", "Please select valid Nav and Pictures folders first.")
+        saved_lines = set(filters.get("lines", []))
+        line_names = sorted(set(list_subdirs(nav_folder) if os.path.isdir(nav_folder) else []) | saved_lines)
+        for i, line in enumerate(line_names):
+            lines_listbox.insert("end", line)
+            if line in saved_lines:
+                lines_listbox.selection_set(i)
+
+        kind_vars = {}
+        kinds = set(filters.get("kinds", PNG_SUBFOLDERS))
+        for col, kind in enumerate(PNG_SUBFOLDERS):
+            kind_vars[kind] = tk.BooleanVar(value=kind in kinds)
+            ttk.Checkbutton(win, text=kind, variable=kind_vars[kind]).grid(row=2, column=col, sticky="w", padx=10, pady=(6, 0))
+
+        date_from_var = tk.StringVar(value=filters.get("date_from", ""))
+        date_to_var = tk.StringVar(value=filters.get("date_to", ""))
+        ttk.Label(win, text="From date (YYYY-MM-DD):").grid(row=3, column=0, sticky="w", padx=10, pady=(6, 0))
+        ttk.Entry(win, textvariable=date_from_var, width=12).grid(row=3, column=1, sticky="w", padx=10, pady=(6, 0))
+        ttk.Label(win, text="To date (YYYY-MM-DD):").grid(row=4, column=0, sticky="w", padx=10)
+        ttk.Entry(win, textvariable=date_to_var, width=12).grid(row=4, column=1, sticky="w", padx=10)
+
+        priority = self.general.get("copy_priority", {})
+        ttk.Separator(win).grid(row=5, column=0, columnspan=2, sticky="ew", padx=10, pady=(10, 4))
+        ttk.Label(win, text="Copy order:").grid(row=6, column=0, columnspan=2, sticky="w", padx=10)
+        newest_first_var = tk.BooleanVar(value=priority.get("newest_first", False))
+        ttk.Checkbutton(win, text="Newest files first", variable=newest_first_var).grid(row=7, column=0, columnspan=2, sticky="w", padx=10)
+        ttk.Label(win, text="Lines first (comma separated):").grid(row=8, column=0, sticky="w", padx=10)
+        priority_lines_var = tk.StringVar(value=", ".join(priority.get("lines", [])))
+        ttk.Entry(win, textvariable=priority_lines_var, width=30).grid(row=8, column=1, sticky="w", padx=10)
+
+        def set_today():
+            today = datetime.now().strftime("%Y-%m-%d")
+            date_from_var.set(today)
+            date_to_var.set(today)
+
+        def save():
+            for var in (date_from_var, date_to_var):
+                value = var.get().strip()
+                if value:
+                    try:
+                        datetime.strptime(value, "%Y-%m-%d")
+                    except ValueError:
+                        messagebox.showerror("Invalid date", f"'{value}' is not a YYYY-MM-DD date.", parent=win)
+                        return
+            self.general["copy_filters"] = {
+                "lines": [lines_listbox.get(i) for i in lines_listbox.curselection()],
+                "kinds": [kind for kind in PNG_SUBFOLDERS if kind_vars[kind].get()],
+                "date_from": date_from_var.get().strip(),
+                "date_to": date_to_var.get().strip(),
+            }
+            self.general["copy_priority"] = {
+                "newest_first": newest_first_var.get(),
+                "lines": [line.strip() for line in priority_lines_var.get().split(",") if line.strip()],
+            }
+            self.save_all_config()
+            self.copied_message_var.set(f"Copy filter: {self.get_copy_filter().describe()}")
+            win.destroy()
+
+        def clear():
+            lines_listbox.selection_clear(0, "end")
+            for var in kind_vars.values():
+                var.set(True)
+            date_from_var.set("")
+            date_to_var.set("")
+
+        btns = ttk.Frame(win)
+        btns.grid(row=9, column=0, columnspan=2, pady=10)
+        ttk.Button(btns, text="Today", command=set_today).pack(side="left", padx=5)
+        ttk.Button(btns, text="Clear", command=clear).pack(side="left", padx=5)
+        ttk.Button(btns, text="Save", command=save).pack(side="left", padx=5)
+        win.columnconfigure(0, weight=1)
+        win.rowconfigure(1, weight=1)
+
+    def apply_copy_rate_limit(self):
+        """Set the copy bandwidth cap from the MB/s box (0 or empty = unlimited); takes effect immediately."""
+        try:
+            mb_per_s = max(0.0, float(self.copy_rate_limit_var.get() or 0))
+        except ValueError:
             return
+        self.copy_limiter.set_rate(mb_per_s * 1024 * 1024)
+        if self.general.get("copy_rate_limit_mb_s", 0) != mb_per_s:
+            self.general["copy_rate_limit_mb_s"] = mb_per_s
+            self.save_all_config()
 
-        def update_progress(current, total):
-            percent = 100 * current / total if total else 0
-            self.copy_progress_var.set(percent)
-            self.copy_progress.update_idletasks()
-            self.copied_message_var.set("")  # Clear previous message
+    def toggle_background_sync(self):
+        enabled = self.background_sync_var.get()
+        self.general["background_sync"] = enabled
+        self.save_all_config()
+        if self._background_sync_after_id is not None:
+            self.after_cancel(self._background_sync_after_id)
+            self._background_sync_after_id = None
+        if enabled:
+            self._schedule_background_sync(0)
+
+    def _schedule_background_sync(self, delay_s=None):
+        if delay_s is None:
+            delay_s = float(self.general.get("background_sync_seconds", BACKGROUND_SYNC_SECONDS))
+        if self._background_sync_after_id is not None:
+            self.after_cancel(self._background_sync_after_id)
+        self._background_sync_after_id = self.after(int(delay_s * 1000), self._run_background_sync)
+
+    def _run_background_sync(self):
+        self._background_sync_after_id = None
+        if not self.background_sync_var.get():
+            return
+        if self._copy_running:
+            # A manual copy is running; its completion schedules the next background pass
+            return
+        if not self.copy_nav_images_to_pictures(background=True):
+            self._schedule_background_sync()
+
+    def copy_nav_images_to_pictures(self, background=False):
+        """
+        Start a nav copy on a worker thread. A background sync reports problems in the
+        status line instead of dialogs. Returns True if a copy was started.
+        """
+        nav_folder = self.nav_image_dir_var.get()
+        pictures_folder = self.image_dir_var.get()
+        if self._copy_running:
+            if not background:
+                messagebox.showinfo("Copy running", "A copy is already running.")
+            return False
+        if not (nav_folder and os.path.isdir(nav_folder) and pictures_folder and os.path.isdir(pictures_folder)):
+            if background:
+                self.status_var.set("Background sync skipped: Nav or Pictures folder not available.")
+            else:
+                messagebox.showerror("Error", "Please select valid Nav and Pictures folders first.")
+            return False
+
+        meter = {"started": time.monotonic()}
+
+        def update_progress(current, total, bytes_done=0, bytes_total=0):
+            # Runs on the copy thread: only post, the Tk loop picks up the latest value
+            now = time.monotonic()
+            if bytes_done == 0:
+                # Start of a copy pass (journal resume or main run): restart the throughput clock
+                meter["started"] = now
+            elapsed = now - meter["started"]
+            rate = bytes_done / elapsed if elapsed > 0 else 0.0
+            eta = (bytes_total - bytes_done) / rate if rate > 0 else None
+            self.progress_bus.post(
+                "copy", current=current, total=total,
+                bytes_done=bytes_done, bytes_total=bytes_total, rate=rate, eta=eta
+            )
 
         # Reset progress
         self.copy_progress_var.set(0)
-        self.copy_progress.update_idletasks()
+        self.copied_message_var.set("")
+        copy_filter = self.get_copy_filter()
+        copy_priority = self.get_copy_priority()
+        live = {"paths": [], "sent": time.monotonic()}
+
+        def copied_callback(dest):
+            # Hand landed files to the GUI every few seconds, so QC sees priority files while the sync runs
+            live["paths"].append(dest)
+            now = time.monotonic()
+            if now - live["sent"] >= LIVE_INGEST_SECONDS:
+                self.progress_bus.call_soon(self.ingest_copied_files, pictures_folder, live["paths"], True)
+                live["paths"], live["sent"] = [], now
 
         # Optionally run in a thread to avoid UI freezing for lots of files
-        import threading
         def run_copy():
-            total_files_copied = self.copy_nav_to_pictures(nav_folder, pictures_folder, progress_callback=update_progress)
-            self.copy_progress_var.set(100)
-            self.try_update_deployment_recovery_dataframes()
-            self.copied_message_var.set(f"Copied {total_files_copied} new PNG files.")
-            
+            try:
+                total_files_copied = self.copy_nav_to_pictures(
+                    nav_folder, pictures_folder, progress_callback=update_progress,
+                    copy_filter=copy_filter, copy_priority=copy_priority, copied_callback=copied_callback
+                )
+            except Exception as e:
+                self.progress_bus.call_soon(self._on_copy_failed, e, background)
+                return
+            self.progress_bus.call_soon(self._on_copy_finished, pictures_folder, total_files_copied)
+
+        self._copy_running = True
         threading.Thread(target=run_copy, daemon=True).start()
+        return True
 
-    def copy_nav_to_pictures(self, nav_folder, pictures_folder, progress_callback=None):
-        deployment_base = os.path.join(pictures_folder, "Deployment")
-        recovery_base = os.path.join(pictures_folder, "Recovery")
+    def _on_copy_failed(self, error, background):
+        self._copy_running = False
+        if background:
+            self.status_var.set(f"Background sync failed: {error}")
+        else:
+            messagebox.showerror("Copy Failed", f"Could not copy nav images:\n{error}")
+        if self.background_sync_var.get():
+            self._schedule_background_sync()
+
+    def _on_copy_progress(self, event):
+        total = event["total"]
+        self.copy_progress_var.set(100 * event["current"] / total if total else 0)
+        if event["bytes_total"]:
+            message = (
+                f"{event['current']}/{total} files, "
+                f"{format_bytes(event['bytes_done'])} of {format_bytes(event['bytes_total'])}"
+            )
+            if event["eta"] is not None:
+                message += f", {event['rate'] / (1024 * 1024):.1f} MB/s, ETA {format_duration(event['eta'])}"
+            self.copied_message_var.set(message)
 
-        # Collect all files to copy for progress reporting
-        file_list = []
-        for line_name in os.listdir(nav_folder):
-            line_path = os.path.join(nav_folder, line_name)
-            if not os.path.isdir(line_path):
-                continue
-            for subfolder in os.listdir(line_path):
-                subfolder_path = os.path.join(line_path, subfolder)
-                if not os.path.isdir(subfolder_path):
-                    continue
+    def plan_nav_images_copy(self):
+        """Dry run of the nav copy: enumerate and compare on a worker thread, then show what would be copied."""
+        nav_folder = self.nav_image_dir_var.get()
+        pictures_folder = self.image_dir_var.get()
+        if not (nav_folder and os.path.isdir(nav_folder) and pictures_folder and os.path.isdir(pictures_folder)):
+            messagebox.showerror("Error", "Please select valid Nav and Pictures folders first.")
+            return
+
+        copy_filter = self.get_copy_filter()
+
+        def run_plan():
+            try:
+                file_list, to_copy, _ = self.plan_nav_copy(
+                    nav_folder, pictures_folder, CopyManifest(COPY_MANIFEST_FILE), copy_filter
+                )
+            except Exception as e:
+                self.progress_bus.call_soon(messagebox.showerror, "Plan Failed", f"Could not plan the copy:\n{e}")
+                return
+            self.progress_bus.call_soon(self.show_copy_plan, summarize_copy_plan(file_list, to_copy))
+
+        self.copied_message_var.set("Planning copy...")
+        threading.Thread(target=run_plan, daemon=True).start()
+
+    def show_copy_plan(self, summary):
+        totals = {key: sum(row[key] for row in summary.values())
+                  for key in ("copy_files", "copy_bytes", "skip_files", "skip_bytes")}
+        self.copied_message_var.set(
+            f"Plan: {totals['copy_files']} files ({format_bytes(totals['copy_bytes'])}) to copy, "
+            f"{totals['skip_files']} already present."
+        )
+
+        win = tk.Toplevel(self)
+        win.title("Copy Plan")
+        win.geometry("700x400")
+        columns = ("Line", "Folder", "To copy", "Size to copy", "Skipped", "Size skipped")
+        tree = ttk.Treeview(win, columns=columns, show="headings")
+        for col in columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=100, minwidth=40, anchor="w" if col == "Line" else "center")
+        vscroll = ttk.Scrollbar(win, orient="vertical", command=tree.yview)
+        tree.config(yscrollcommand=vscroll.set)
+        for (line, kind), row in summary.items():
+            tree.insert("", "end", values=(
+                line, kind,
+                row["copy_files"], format_bytes(row["copy_bytes"]),
+                row["skip_files"], format_bytes(row["skip_bytes"]),
+            ))
+        tree.insert("", "end", values=(
+            "Total", "",
+            totals["copy_files"], format_bytes(totals["copy_bytes"]),
+            totals["skip_files"], format_bytes(totals["skip_bytes"]),
+        ))
+        ttk.Button(win, text="Close", command=win.destroy).pack(side="bottom", pady=5)
+        vscroll.pack(side="right", fill="y")
+        tree.pack(fill="both", expand=True)
+
+    def _on_copy_finished(self, pictures_folder, total_files_copied):
+        self._copy_running = False
+        if self.background_sync_var.get():
+            self._schedule_background_sync()
+        self.copy_progress_var.set(100)
+        stats = self.last_copy_stats
+        self.ingest_copied_files(pictures_folder, stats.get("copied_paths", []))
+        message = f"Copied {total_files_copied} new PNG files"
+        if total_files_copied:
+            message += f" ({stats['mb_per_s']:.1f} MB/s, {stats['files_per_s']:.1f} files/s)"
+        if stats["errors"]:
+            message += f", {len(stats['errors'])} failed"
+        self.copied_message_var.set(message + ".")
+
+    def collect_nav_png_files(self, nav_folder, pictures_folder, copy_filter=None):
+        """
+        List the PNG files under nav_folder/<line>/<deploy*|recover*>/, sorted by line,
+        subfolder and name. Line folders and their subfolders are listed in parallel.
+        A CopyFilter prunes lines and subfolders before they are listed and drops
+        files outside its date window right after.
+        Returns one dict per file: line, subfolder, kind, src, dest, size, mtime_ns.
+        """
+        max_workers = int(self.general.get("scan_workers", SCAN_WORKERS))
+        copy_filter = copy_filter or CopyFilter()
+
+        line_names = [line for line in list_subdirs(nav_folder) if copy_filter.accepts_line(line)]
+        line_subfolders = map_parallel(lambda line: list_subdirs(os.path.join(nav_folder, line)), line_names, max_workers)
+        sources = []
+        for line_name, subfolders in zip(line_names, line_subfolders):
+            for subfolder in subfolders:
                 subfolder_lower = subfolder.lower()
                 if subfolder_lower.startswith('deploy'):
-                    dest_base = deployment_base
+                    kind = "Deployment"
                 elif subfolder_lower.startswith('recover'):
-                    dest_base = recovery_base
+                    kind = "Recovery"
                 else:
                     continue
-                for fname in os.listdir(subfolder_path):
-                    if fname.lower().endswith('.png'):
-                        file_list.append((subfolder, line_name, subfolder_path, fname, dest_base))
+                if copy_filter.accepts_kind(kind):
+                    sources.append((line_name, subfolder, kind))
+        entries_per_source = map_parallel(
+            lambda src: copy_filter.select_entries(list_png_entries(os.path.join(nav_folder, src[0], src[1]))),
+            sources, max_workers
+        )
 
-        total_files = len(file_list)
-        copied_count = 0
-
-        for idx, (subfolder, line_name, src_subfolder, fname, dest_base) in enumerate(file_list):
-            dest_line_folder = os.path.join(dest_base, line_name)
-            os.makedirs(dest_line_folder, exist_ok=True)
-            src_file = os.path.join(src_subfolder, fname)
-            dest_file = os.path.join(dest_line_folder, fname)
-
-            # Skip if file exists and creation time matches
-            if os.path.exists(dest_file):
-                # File already exists with same creation time, skip
-                if progress_callback:
-                    progress_callback(idx + 1, total_files)
-                continue
+        file_list = []
+        for (line_name, subfolder, kind), entries in zip(sources, entries_per_source):
+            for fname, size, mtime_ns in entries:
+                file_list.append({
+                    "line": line_name,
+                    "subfolder": subfolder,
+                    "kind": kind,
+                    "src": os.path.join(nav_folder, line_name, subfolder, fname),
+                    "dest": os.path.join(pictures_folder, kind, line_name, fname),
+                    "size": size,
+                    "mtime_ns": mtime_ns,
+                })
+        return file_list
+
+    def select_files_to_copy(self, file_list, manifest_rows):
+        """
+        Split file_list into (to_copy, to_adopt). A file recorded in the manifest with the
+        same destination, size and mtime is done. Only files unknown to the manifest have
+        their destination stat-ed: an existing copy with matching size and mtime is adopted
+        into the manifest, anything else (missing, truncated, changed) is copied again.
+        """
+        to_copy, unknown = [], []
+        for item in file_list:
+            row = manifest_rows.get(item["src"])
+            if row is None or row["dest"] != item["dest"]:
+                unknown.append(item)
+            elif row["size"] != item["size"] or row["mtime_ns"] != item["mtime_ns"]:
+                to_copy.append(item)
+
+        def dest_matches(item):
+            try:
+                st = os.stat(item["dest"])
+            except OSError:
+                return False
+            # copy2 keeps the mtime; allow for the 2 s resolution of FAT/SMB timestamps
+            return st.st_size == item["size"] and abs(st.st_mtime_ns - item["mtime_ns"]) < 2_000_000_000
+
+        to_adopt = []
+        max_workers = int(self.general.get("scan_workers", SCAN_WORKERS))
+        for item, matches in zip(unknown, map_parallel(dest_matches, unknown, max_workers)):
+            (to_adopt if matches else to_copy).append(item)
+        return to_copy, to_adopt
+
+    def plan_nav_copy(self, nav_folder, pictures_folder, manifest, copy_filter=None):
+        """
+        Enumerate the nav sources and decide what needs copying, without writing anything.
+        Returns (file_list, to_copy, to_adopt).
+        """
+        file_list = self.collect_nav_png_files(nav_folder, pictures_folder, copy_filter)
+        to_copy, to_adopt = self.select_files_to_copy(file_list, manifest.load())
+        return file_list, to_copy, to_adopt
+
+    def copy_nav_to_pictures(self, nav_folder, pictures_folder, progress_callback=None, copy_filter=None,
+                             copy_priority=None, copied_callback=None):
+        manifest = CopyManifest(COPY_MANIFEST_FILE)
+        # Finish an interrupted sync first: its journal lists the files left to do. Entries
+        # whose source is gone or changed since they were listed are dropped; the plan
+        # below picks up whatever still needs copying from a fresh listing. The journal
+        # may come from a sync with other filters, so only what this one selects resumes.
+        resumed = manifest.pending_journal(nav_folder, pictures_folder)
+        if copy_filter is not None:
+            resumed = copy_filter.select_items(resumed)
+        max_workers = int(self.general.get("scan_workers", SCAN_WORKERS))
+        current = map_parallel(self._journal_item_current, resumed, max_workers)
+        manifest.drop_journal([item["src"] for item, ok in zip(resumed, current) if not ok])
+        resumed = [item for item, ok in zip(resumed, current) if ok]
+        resumed_stats = None
+        if resumed:
+            resumed_stats = self._run_copy_jobs(
+                manifest, resumed, 0, len(resumed), progress_callback, copied_callback
+            )
+            if resumed_stats["stopped"]:
+                # Closed mid-sync: keep the rest of the journal for the next start
+                self.last_copy_stats = resumed_stats
+                return resumed_stats["files"]
+            manifest.clear_journal()
 
-            shutil.copy2(src_file, dest_file)
-            copied_count += 1
-            if progress_callback:
-                progress_callback(idx + 1, total_files)
-        return copied_count
-        # Example usage:
-        # nav_folder = self.nav_image_dir_var.get()
-        # pictures_folder = self.image_dir_var.get()
-        # copy_nav_to_pictures(nav_folder, pictures_folder)
+        # Collect all files to copy for progress reporting
+        file_list, to_copy, to_adopt = self.plan_nav_copy(nav_folder, pictures_folder, manifest, copy_filter)
+        total_files = len(file_list)
+        if copy_priority is not None:
+            # The journal keeps this order, so a resumed sync continues with the most urgent files
+            to_copy = copy_priority.order(to_copy)
+        manifest.record([(i["src"], i["dest"], i["size"], i["mtime_ns"], None) for i in to_adopt])
+        manifest.start_journal(nav_folder, pictures_folder, to_copy)
+        stats = self._run_copy_jobs(
+            manifest, to_copy, total_files - len(to_copy), total_files, progress_callback, copied_callback
+        )
+        # Copied files left the journal one by one; failed ones are not kept either, so a
+        # file that keeps failing can't block later syncs (the next plan re-lists it).
+        # A stopped sync keeps its journal and resumes from it next time.
+        if not stats["stopped"]:
+            manifest.clear_journal()
+        if resumed_stats is not None:
+            stats["files"] += resumed_stats["files"]
+            stats["bytes"] += resumed_stats["bytes"]
+            stats["errors"] = resumed_stats["errors"] + stats["errors"]
+            stats["copied_paths"] = resumed_stats["copied_paths"] + stats["copied_paths"]
+        self.last_copy_stats = stats
+        return stats["files"]
+
+    @staticmethod
+    def _journal_item_current(item):
+        """True if a journaled source still exists with the size and mtime it was listed with."""
+        try:
+            st = os.stat(item["src"])
+        except OSError:
+            return False
+        return st.st_size == item["size"] and st.st_mtime_ns == item["mtime_ns"]
+
+    def _run_copy_jobs(self, manifest, to_copy, skipped, total_files, progress_callback=None, copied_callback=None):
+        """
+        Copy the items atomically on the CopyEngine, recording each finished file in the
+        manifest/journal. copied_callback(dest) is called after each file lands.
+        """
+        items_by_src = {item["src"]: item for item in to_copy}
+        verify = bool(self.general.get("copy_verify_checksum", False))
+        backend = COPY_BACKENDS.get(self.general.get("copy_backend", "shutil"), shutil.copy2)
+        limiter = self.copy_limiter
+
+        def copy_func_backend(src, tmp):
+            # Decided per file, so a cap set mid-sync applies from the next file
+            if limiter.bytes_per_s > 0:
+                copy_file_throttled(src, tmp, limiter)
+            else:
+                backend(src, tmp)
+
+        def copy_func(src, dest):
+            item = items_by_src[src]
+
+            def check(tmp):
+                if os.path.getsize(tmp) != item["size"]:
+                    raise OSError(f"size mismatch after copy: {dest}")
+                if verify:
+                    item["checksum"] = file_checksum(src)
+                    if file_checksum(tmp) != item["checksum"]:
+                        raise OSError(f"checksum mismatch after copy: {dest}")
+
+            copy_file_atomic(src, dest, verify=check, copy_func=copy_func_backend)
+
+        pending_records = []
+        copied_paths = []
+
+        def on_copied(src, dest):
+            copied_paths.append(dest)
+            if copied_callback:
+                copied_callback(dest)
+            # Leave the journal right away, so a crash never re-copies a finished file;
+            # the manifest rows are written in batches
+            manifest.drop_journal([src])
+            item = items_by_src[src]
+            pending_records.append((src, dest, item["size"], item["mtime_ns"], item.get("checksum")))
+            if len(pending_records) >= 25:
+                manifest.record(pending_records)
+                pending_records.clear()
+
+        bytes_total = sum(item["size"] for item in to_copy)
+        if progress_callback:
+            progress_callback(skipped, total_files, 0, bytes_total)
+        engine = CopyEngine(
+            max_workers=int(self.general.get("copy_workers", COPY_WORKERS)), copy_func=copy_func,
+            stop_event=self.copy_stop,
+        )
+        self._copy_engine = engine
+        try:
+            stats = engine.run(
+                [(item["src"], item["dest"]) for item in to_copy],
+                progress_callback=(
+                    lambda done, total, nbytes: progress_callback(skipped + done, total_files, nbytes, bytes_total)
+                ) if progress_callback else None,
+                on_copied=on_copied,
+            )
+            stats["copied_paths"] = copied_paths
+            return stats
+        finally:
+            self._copy_engine = None
+            manifest.record(pending_records)
 
     def refresh_png_views(self):
         folder = self.image_dir_var.get()
-        if folder and os.path.isdir(folder):
-            self.populate_deployment_recovery_lists(folder)
-        else:
+        if not (folder and os.path.isdir(folder)):
             messagebox.showinfo("Info", "No valid pictures folder selected.")
-
-    def list_png_files_recursive(self, root_folder):
-        png_files = []
-        for root, _, files in os.walk(root_folder):
-            for file in files:
-                if file.lower().endswith('.png'):
-                    relpath = os.path.relpath(os.path.join(root, file), root_folder)
-                    png_files.append(relpath)
-        return png_files
+            return
+        if self.inventory.root != folder:
+            self.populate_deployment_recovery_lists(folder)
+            return
+        previous = self.inventory
+
+        def on_done(inventory):
+            self.inventory = inventory
+            changes = inventory.diff(previous)
+            self.fill_deployment_recovery_listboxes()
+            if hasattr(self, "format_dialog"):
+                self.format_dialog.update_samples()
+            self.apply_inventory_changes(changes)
+            self._ensure_folder_watch()
+            added = sum(len(c["added"]) for c in changes.values())
+            removed = sum(len(c["removed"]) for c in changes.values())
+            renamed = sum(len(c["renamed"]) for c in changes.values())
+            self.scan_status_var.set(f"Refresh: {added} new, {removed} removed, {renamed} moved.")
+
+        # The worker gets a snapshot: watcher and copy ingest keep editing previous.dirs meanwhile
+        self.start_folder_scan(folder, on_done, known=previous.copy().dirs)
 
     def get_deployment_png_filenames(self):
-        folder = self.image_dir_var.get()
-        if not (folder and os.path.isdir(folder)):
-            return []
-        deployment_path = None
-        for root, dirs, files in os.walk(folder):
-            for d in dirs:
-                if d == "Deployment":
-                    deployment_path = os.path.join(root, d)
-                    break
-            if deployment_path:
-                break
-        if deployment_path and os.path.isdir(deployment_path):
-            return self.list_png_files_recursive(deployment_path)
-        else:
-            return []
+        return self.inventory.relpaths("Deployment")
 
     def open_selected_image(self, source):
         if source == "deployment":
             listbox = self.deployment_listbox
-            folder = self.image_dir_var.get()
-            subfolder = "Deployment"
+            kind = "Deployment"
         else:
             listbox = self.recovery_listbox
-            folder = self.image_dir_var.get()
-            subfolder = "Recovery"
-        if not folder or not os.path.isdir(folder):
-            return
-        files = []
-        dir_path = None
-        for root, dirs, _ in os.walk(folder):
-            if subfolder in dirs:
-                dir_path = os.path.join(root, subfolder)
-                break
-        if not dir_path or not os.path.isdir(dir_path):
-            return
-        for root, _, fs in os.walk(dir_path):
-            for f in fs:
-                if f.lower().endswith('.png'):
-                    files.append(os.path.join(root, f))
-        files.sort()
+            kind = "Recovery"
+        files = self.image_files[kind]
         sel = listbox.curselection()
         if not sel:
             return
         selected_idx = sel[0]
-        if selected_idx >= len(files):
-            return
-        full_path = files[selected_idx]
+        if listbox.size() != len(files) or selected_idx >= len(files):
+            return  # placeholder row ("No PNG files found" / subdirectory not found)
         self.open_image_viewer(files, selected_idx, source)
 
     def open_image_viewer(self, files, index, source):
@@ -920,6 +3292,8 @@ class App(tk.Tk):
             self.image_viewer_files = []
             self.image_viewer_index = 0
             self.image_viewer_source = None
+            self.image_viewer_path = None
+            self.viewer_prefetcher.prefetch([])
             win.destroy()
         win.protocol("WM_DELETE_WINDOW", on_close)
 
@@ -927,18 +3301,66 @@ class App(tk.Tk):
         if not self.image_viewer_files or self.image_viewer_index < 0 or self.image_viewer_index >= len(self.image_viewer_files):
             return
         filepath = self.image_viewer_files[self.image_viewer_index]
+        self.image_viewer_path = filepath
         try:
-            img = Image.open(filepath)
-            w, h = img.size
-            max_w, max_h = 760, 520
-            ratio = min(max_w / w, max_h / h, 1.0)
-            img = img.resize((int(w * ratio), int(h * ratio)), Image.Resampling.LANCZOS)
+            # Ready preview (prefetched or cached on disk), else a fast low-quality one refined in the background
+            img = self.viewer_prefetcher.peek(filepath)
+            if img is None and self.thumbnail_cache is not None:
+                try:
+                    img = self.thumbnail_cache.get(filepath, VIEWER_IMAGE_SIZE)
+                except sqlite3.Error:
+                    img = None
+                if img is not None:
+                    self.viewer_prefetcher.store(filepath, img)
+            if img is None:
+                decoded = open_for_preview(filepath, VIEWER_IMAGE_SIZE)
+                img = fast_preview(decoded, VIEWER_IMAGE_SIZE)
+                self.viewer_prefetcher.refine(filepath, decoded, self._on_viewer_image_refined)
             self.image_viewer_img = ImageTk.PhotoImage(img)
             self.image_viewer_image_label.config(image=self.image_viewer_img)
             self.image_viewer_window.title(f"Image Viewer - {os.path.basename(filepath)} ({self.image_viewer_index+1}/{len(self.image_viewer_files)})")
         except Exception as e:
             self.image_viewer_image_label.config(text=f"Could not open image:\n{filepath}\n{e}", image="")
             self.image_viewer_img = None
+        self._prefetch_viewer_neighbours()
+
+    def _on_viewer_image_refined(self, filepath, img):
+        # Worker thread: keep the refined preview on disk, then swap it in on the Tk thread
+        if self.thumbnail_cache is not None:
+            try:
+                st = os.stat(filepath)
+                self.thumbnail_cache.put(filepath, VIEWER_IMAGE_SIZE, img, st.st_size, st.st_mtime_ns)
+            except (OSError, sqlite3.Error):
+                pass
+        self.progress_bus.call_soon(self._show_refined_viewer_image, filepath, img)
+
+    def _show_refined_viewer_image(self, filepath, img):
+        if self.image_viewer_window is None or not self.image_viewer_files:
+            return
+        if self.image_viewer_files[self.image_viewer_index] != filepath:
+            return
+        self.image_viewer_img = ImageTk.PhotoImage(img)
+        self.image_viewer_image_label.config(image=self.image_viewer_img)
+
+    def _prefetch_viewer_neighbours(self):
+        """Decode the N files either side of the current one in the background, nearest first."""
+        n = int(self.general.get("viewer_prefetch", VIEWER_PREFETCH))
+        files, index = self.image_viewer_files, self.image_viewer_index
+        paths = []
+        for offset in range(1, n + 1):
+            for i in (index + offset, index - offset):
+                if 0 <= i < len(files):
+                    paths.append(files[i])
+        self.viewer_prefetcher.prefetch(paths)
+
+    def load_preview_image(self, filepath, box):
+        """Scaled preview for the viewer/gallery, read from the thumbnail cache when possible."""
+        if self.thumbnail_cache is not None:
+            try:
+                return self.thumbnail_cache.thumbnail(filepath, box)
+            except sqlite3.Error:
+                pass
+        return load_preview(filepath, box)
 
     def image_viewer_back(self):
         if self.image_viewer_index > 0:
@@ -1174,7 +3596,8 @@ class App(tk.Tk):
         )
         self.format_dialog.pack(fill="x", pady=(5, 10), padx=5)
 
-        self.try_update_deployment_recovery_dataframes()
+        # The inventory was built by the Images tab; only the dataframes need the format
+        self.update_deployment_recovery_dataframes()
 
         self.excel_filename_var = tk.StringVar()
         self.btn_frame = ttk.Frame(frm)
@@ -1438,7 +3861,10 @@ class App(tk.Tk):
         if filename:
             try:
                 # Only export the selected columns
+                self.progress_bus.post("export", message=f"Writing {len(self.export_df)} rows to CSV...")
+                self._pump_progress()
                 self.export_df[selected_cols].to_csv(filename, index=False)
+                self.progress_bus.post("export", message=f"Exported {len(self.export_df)} rows to {os.path.basename(filename)}.")
                 self.general["last_export_csv_filename"] = filename
                 self.save_all_config()
                 messagebox.showinfo("Export Successful", f"Exported to {filename}")
@@ -1576,7 +4002,10 @@ class App(tk.Tk):
                 date_col_indices = [i for i, name in enumerate(col_names) if name in date_cols]
 
                 # Format all data cells and apply logic (including date formatting)
-                for row in ws.iter_rows(min_row=2, max_row=ws.max_row, min_col=1, max_col=ws.max_column):
+                total_rows = ws.max_row - 1
+                for row_num, row in enumerate(ws.iter_rows(min_row=2, max_row=ws.max_row, min_col=1, max_col=ws.max_column), 1):
+                    self.progress_bus.post("export", message="Formatting Excel rows...", current=row_num, total=total_rows)
+                    self._pump_progress()
                     for colidx, cell in enumerate(row, 0):
                         cell.font = cell_font
                         # "Comment" column: no wrap, left-align; others: wrap, center-align
@@ -1604,7 +4033,10 @@ class App(tk.Tk):
                             except Exception:
                                 pass
 
+                self.progress_bus.post("export", message="Saving Excel file...")
+                self._pump_progress()
                 wb.save(filename)
+                self.progress_bus.post("export", message=f"Exported {total_rows} rows to {os.path.basename(filename)}.")
                 self.general["last_export_excel_filename"] = filename
                 self.save_all_config()
                 messagebox.showinfo("Export Successful", f"Exported to {filename}")
@@ -1659,6 +4091,8 @@ class App(tk.Tk):
             # Now update all rows
             data_rows = list(ws.iter_rows(min_row=2, max_row=ws.max_row, min_col=1, max_col=len(excel_cols)))
             for row_idx in range(num_rows_df):
+                self.progress_bus.post("export", message="Updating Excel rows...", current=row_idx + 1, total=num_rows_df)
+                self._pump_progress()
                 for excel_col, df_col in col_mapping.items():
                     if excel_col not in excel_cols or df_col not in self.export_df.columns:
                         continue
@@ -1677,6 +4111,7 @@ class App(tk.Tk):
                         cell.value = value
 
             wb.save(filename)
+            self.progress_bus.post("export", message=f"Updated {num_rows_df} rows in {os.path.basename(filename)}.")
             messagebox.showinfo("Update successful", f"Excel file updated: {filename}")
             # Open the file as before:
             if sys.platform == "win32":
@@ -1709,5 +4144,11 @@ class App(tk.Tk):
             self.csv_file_var.set(csv_file)
 
 if __name__ == "__main__":
+    if "--bench-copy" in sys.argv:
+        # Optional target folder, e.g. a mounted share: --bench-copy /mnt/share
+        args = sys.argv[sys.argv.index("--bench-copy") + 1:]
+        for name, mb_per_s in bench_copy_backends(folder=args[0] if args else None).items():
+            print(f"{name:10s} {mb_per_s:8.1f} MB/s")
+        sys.exit(0)
     app = App()
     app.mainloop()